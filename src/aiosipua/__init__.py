@@ -24,6 +24,7 @@ from .headers import (
     parse_params,
     parse_uri,
     parse_via,
+    parse_via_list,
     prettify_header_name,
     stringify_address,
     stringify_auth,
@@ -35,6 +36,7 @@ from .message import (
     SipMessage,
     SipRequest,
     SipResponse,
+    parse_content_length,
 )
 from .rtp_bridge import (
     CallSession,
@@ -120,11 +122,13 @@ __all__ = [
     "negotiate_sdp",
     "parse_address",
     "parse_auth",
+    "parse_content_length",
     "parse_cseq",
     "parse_params",
     "parse_sdp",
     "parse_uri",
     "parse_via",
+    "parse_via_list",
     "prettify_header_name",
     "serialize_sdp",
     "stringify_address",
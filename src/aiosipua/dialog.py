@@ -12,7 +12,14 @@ import enum
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from .headers import CSeq, Via, stringify_cseq, stringify_via
+from .headers import (
+    CSeq,
+    Via,
+    parse_address,
+    stringify_cseq,
+    stringify_uri,
+    stringify_via,
+)
 from .utils import generate_branch, generate_tag
 
 if TYPE_CHECKING:
@@ -27,7 +34,7 @@ class DialogState(enum.Enum):
     TERMINATED = "terminated"
 
 
-@dataclass
+@dataclass(slots=True)
 class Dialog:
     """A SIP dialog — a persistent relationship between two UAs.
 
@@ -195,30 +202,24 @@ def create_dialog_from_request(
     # Extract remote URI from From header
     remote_uri = ""
     if from_addr and from_addr.uri:
-        from .headers import stringify_uri
-
         remote_uri = stringify_uri(from_addr.uri)
 
     # Extract local URI from To header
     if local_uri is None:
         to_addr = request.to_addr
-        if to_addr and to_addr.uri:
-            from .headers import stringify_uri
-
-            local_uri = stringify_uri(to_addr.uri)
-        else:
-            local_uri = request.uri
+        local_uri = stringify_uri(to_addr.uri) if to_addr and to_addr.uri else request.uri
 
-    # Remote target from Contact
+    # Remote target from the first Contact (only that one is parsed)
     remote_target = ""
-    contacts = request.contact
-    if contacts:
-        from .headers import stringify_uri
-
-        remote_target = stringify_uri(contacts[0].uri)
+    contact = request.headers.get_first("contact")
+    if contact:
+        remote_target = stringify_uri(parse_address(contact).uri)
 
-    # Route set from Record-Route (reversed for UAS per RFC 3261 §12.1.1)
-    route_set = list(reversed(request.headers.get("record-route")))
+    # Route set from Record-Route (reversed for UAS per RFC 3261 §12.1.1);
+    # most requests reaching an endpoint carry none, so skip the copy then.
+    route_set: list[str] = []
+    if "record-route" in request.headers:
+        route_set = request.headers.get("record-route")[::-1]
 
     # Extract CSeq
     cseq = request.cseq
@@ -238,26 +239,29 @@ def create_dialog_from_request(
     )
 
 
+# Default reason phrases for common status codes (RFC 3261 §21)
+_DEFAULT_REASONS: dict[int, str] = {
+    100: "Trying",
+    180: "Ringing",
+    183: "Session Progress",
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    480: "Temporarily Unavailable",
+    481: "Call/Transaction Does Not Exist",
+    486: "Busy Here",
+    487: "Request Terminated",
+    488: "Not Acceptable Here",
+    500: "Server Internal Error",
+    503: "Service Unavailable",
+    603: "Decline",
+}
+
+
 def _default_reason(status_code: int) -> str:
     """Return a default reason phrase for common status codes."""
-    reasons: dict[int, str] = {
-        100: "Trying",
-        180: "Ringing",
-        183: "Session Progress",
-        200: "OK",
-        400: "Bad Request",
-        401: "Unauthorized",
-        403: "Forbidden",
-        404: "Not Found",
-        405: "Method Not Allowed",
-        408: "Request Timeout",
-        480: "Temporarily Unavailable",
-        481: "Call/Transaction Does Not Exist",
-        486: "Busy Here",
-        487: "Request Terminated",
-        488: "Not Acceptable Here",
-        500: "Server Internal Error",
-        503: "Service Unavailable",
-        603: "Decline",
-    }
-    return reasons.get(status_code, "")
+    return _DEFAULT_REASONS.get(status_code, "")
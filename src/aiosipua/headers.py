@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal, overload
 
@@ -25,9 +26,18 @@ COMPACT_HEADERS: dict[str, str] = {
 }
 
 
+# Both letter cases, so lookups need no ``.lower()`` call
+_COMPACT_ANY_CASE: dict[str, str] = {
+    **COMPACT_HEADERS,
+    **{short.upper(): full for short, full in COMPACT_HEADERS.items()},
+}
+
+
 def expand_compact_header(name: str) -> str:
     """Expand a single-letter compact header name to its full form."""
-    return COMPACT_HEADERS.get(name.lower(), name)
+    if len(name) != 1:
+        return name
+    return _COMPACT_ANY_CASE.get(name, name)
 
 
 # --- Header name prettification ---
@@ -83,8 +93,13 @@ _PRETTY_NAMES: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def prettify_header_name(name: str) -> str:
-    """Return the canonical casing for a known SIP header, or title-case fallback."""
+    """Return the canonical casing for a known SIP header, or title-case fallback.
+
+    Memoized, so the title-case fallback for recurring ``X-*`` headers is
+    computed once rather than on every serialize.
+    """
     pretty = _PRETTY_NAMES.get(name.lower())
     if pretty is not None:
         return pretty
@@ -117,71 +132,76 @@ MULTI_INSTANCE_HEADERS: frozenset[str] = frozenset(
 # --- Case-insensitive header dict ---
 
 
+# Case folding runs once per distinct spelling while it stays in the bounded
+# LRU, so arbitrary names from the wire cannot grow it without limit.
+# ``str.lower()`` is kept as it already has an ASCII fast path and beats
+# ``translate``-based folding.
+@functools.lru_cache(maxsize=1024)
+def _header_key(name: str) -> str:
+    """Return the lowercase lookup key for a header name."""
+    return name.lower()
+
+
 class CaseInsensitiveDict:
-    """Case-insensitive dict for SIP headers, preserving original casing."""
+    """Case-insensitive dict for SIP headers, preserving original casing.
 
-    def __init__(self) -> None:
-        self._store: dict[str, list[str]] = {}
-        self._original: dict[str, str] = {}
+    Backed by a single insertion-ordered dict mapping the lowercase key to an
+    ``(original_name, values)`` pair, so each operation is one hash lookup.
+    """
 
-    def _key(self, name: str) -> str:
-        return name.lower()
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str, list[str]]] = {}
 
     def get(self, name: str) -> list[str]:
         """Get all values for a header, or empty list if absent."""
-        return self._store.get(self._key(name), [])
+        entry = self._entries.get(_header_key(name))
+        return entry[1] if entry is not None else []
 
     def get_first(self, name: str, default: str | None = None) -> str | None:
         """Get the first value for a header, or *default* if absent."""
-        values = self._store.get(self._key(name))
-        if values:
-            return values[0]
+        entry = self._entries.get(_header_key(name))
+        if entry is not None and entry[1]:
+            return entry[1][0]
         return default
 
     def set_single(self, name: str, value: str) -> None:
         """Set a header to exactly one value, replacing any existing values."""
-        key = self._key(name)
-        self._store[key] = [value]
-        self._original[key] = name
+        self._entries[_header_key(name)] = (name, [value])
 
     def append(self, name: str, value: str) -> None:
         """Append a value to a header (creates if absent)."""
-        key = self._key(name)
-        if key not in self._store:
-            self._store[key] = []
-            self._original[key] = name
-        self._store[key].append(value)
+        key = _header_key(name)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = (name, [value])
+        else:
+            entry[1].append(value)
 
     def remove(self, name: str) -> None:
         """Remove all values for a header."""
-        key = self._key(name)
-        self._store.pop(key, None)
-        self._original.pop(key, None)
+        self._entries.pop(_header_key(name), None)
 
     def __contains__(self, name: str) -> bool:
-        return self._key(name) in self._store
+        return _header_key(name) in self._entries
 
     def __len__(self) -> int:
-        return len(self._store)
+        return len(self._entries)
 
     def items(self) -> Iterator[tuple[str, list[str]]]:
         """Yield ``(original_cased_name, values)`` pairs."""
-        for key, values in self._store.items():
-            yield self._original[key], values
+        return iter(self._entries.values())
 
     def copy(self) -> CaseInsensitiveDict:
         """Return a shallow copy."""
         new = CaseInsensitiveDict()
-        for key, values in self._store.items():
-            new._store[key] = list(values)
-            new._original[key] = self._original[key]
+        new._entries = {key: (name, list(values)) for key, (name, values) in self._entries.items()}
         return new
 
 
 # --- Dataclasses ---
 
 
-@dataclass
+@dataclass(slots=True)
 class SipUri:
     """SIP or SIPS URI (RFC 3261 §19.1)."""
 
@@ -193,7 +213,7 @@ class SipUri:
     headers: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     """SIP name-addr or addr-spec (RFC 3261 §20.10)."""
 
@@ -214,7 +234,7 @@ class Address:
             self.params["tag"] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class Via:
     """SIP Via header value (RFC 3261 §20.42)."""
 
@@ -258,7 +278,7 @@ class Via:
             self.params["rport"] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class CSeq:
     """CSeq header (RFC 3261 §20.16)."""
 
@@ -266,7 +286,7 @@ class CSeq:
     method: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthChallenge:
     """WWW-Authenticate or Proxy-Authenticate header value."""
 
@@ -274,7 +294,7 @@ class AuthChallenge:
     params: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthCredentials:
     """Authorization or Proxy-Authorization header value."""
 
@@ -292,47 +312,57 @@ def parse_params(s: str) -> dict[str, str | None]:
     """
     params: dict[str, str | None] = {}
     for part in s.split(";"):
-        part = part.strip()
-        if not part:
-            continue
-        if "=" in part:
-            key, _, val = part.partition("=")
+        # One partition per token: no separate "=" membership scan or pre-strip
+        key, sep, val = part.partition("=")
+        if sep:
             params[key.strip().lower()] = val.strip()
         else:
-            params[part.lower()] = None
+            key = key.strip()
+            if key:
+                params[key.lower()] = None
     return params
 
 
 def parse_uri(s: str) -> SipUri:
     """Parse a SIP/SIPS URI string into a :class:`SipUri`."""
     s = s.strip()
-    uri = SipUri()
+    # Fields are gathered into locals and the SipUri is built once at the
+    # end, so no default params/headers dicts are allocated and discarded.
+    scheme = "sip"
+    user: str | None = None
+    port: int | None = None
+    params: dict[str, str | None] = {}
+    headers: dict[str, str] = {}
 
     # scheme
-    if ":" in s and s.split(":", 1)[0].lower() in ("sip", "sips"):
-        scheme_part, _, rest = s.partition(":")
-        uri.scheme = scheme_part.lower()
+    scheme_part, sep, rest = s.partition(":")
+    scheme_part = scheme_part.lower()
+    if sep and scheme_part in ("sip", "sips"):
+        scheme = scheme_part
     else:
         rest = s
 
+    # Each component is peeled off with a single partition; the separator
+    # result tells whether it was present, so nothing is scanned twice.
+
     # headers (after ?)
-    if "?" in rest:
-        rest, _, header_part = rest.partition("?")
+    rest, sep, header_part = rest.partition("?")
+    if sep:
         for hdr in header_part.split("&"):
-            if "=" in hdr:
-                hk, _, hv = hdr.partition("=")
-                uri.headers[hk] = hv
+            hk, eq, hv = hdr.partition("=")
+            if eq:
+                headers[hk] = hv
 
     # params (after ;) — but we need to find the first ; that's not part of the hostport
     # user@host:port;params
-    if ";" in rest:
-        base, _, param_str = rest.partition(";")
-        uri.params = parse_params(param_str)
-        rest = base
+    rest, sep, param_str = rest.partition(";")
+    if sep:
+        params = parse_params(param_str)
 
     # user@host
-    if "@" in rest:
-        uri.user, _, hostport = rest.partition("@")
+    user_part, sep, hostport = rest.partition("@")
+    if sep:
+        user = user_part
     else:
         hostport = rest
 
@@ -340,23 +370,24 @@ def parse_uri(s: str) -> SipUri:
     if hostport.startswith("["):
         bracket_end = hostport.find("]")
         if bracket_end != -1:
-            uri.host = hostport[: bracket_end + 1]
+            host = hostport[: bracket_end + 1]
             after = hostport[bracket_end + 1 :]
             if after.startswith(":"):
-                uri.port = int(after[1:])
+                port = int(after[1:])
         else:
-            uri.host = hostport
-    elif ":" in hostport:
-        host_part, _, port_part = hostport.rpartition(":")
-        uri.host = host_part
-        try:
-            uri.port = int(port_part)
-        except ValueError:
-            uri.host = hostport
+            host = hostport
     else:
-        uri.host = hostport
+        host_part, sep, port_part = hostport.rpartition(":")
+        if sep:
+            host = host_part
+            try:
+                port = int(port_part)
+            except ValueError:
+                host = hostport
+        else:
+            host = hostport
 
-    return uri
+    return SipUri(scheme=scheme, user=user, host=host, port=port, params=params, headers=headers)
 
 
 def stringify_uri(uri: SipUri) -> str:
@@ -381,7 +412,8 @@ def stringify_uri(uri: SipUri) -> str:
 def parse_address(s: str) -> Address:
     """Parse a SIP address (name-addr or addr-spec) into an :class:`Address`."""
     s = s.strip()
-    addr = Address()
+    display_name: str | None = None
+    params: dict[str, str | None] = {}
 
     # name-addr form: "Display Name" <uri>;params  or  <uri>;params
     lt = s.find("<")
@@ -390,12 +422,12 @@ def parse_address(s: str) -> Address:
         display = s[:lt].strip()
         if display.startswith('"') and display.endswith('"'):
             display = display[1:-1]
-        addr.display_name = display if display else None
+        display_name = display if display else None
         uri_str = s[lt + 1 : gt]
-        addr.uri = parse_uri(uri_str)
+        uri = parse_uri(uri_str)
         after = s[gt + 1 :].strip()
         if after.startswith(";"):
-            addr.params = parse_params(after[1:])
+            params = parse_params(after[1:])
     else:
         # addr-spec form: uri;params (no angle brackets)
         # Separate URI params from address params — tricky because they share ';'
@@ -413,13 +445,13 @@ def parse_address(s: str) -> Address:
                     addr_params.append(stripped)
                 else:
                     uri_parts.append(part)
-            addr.uri = parse_uri(";".join(uri_parts))
+            uri = parse_uri(";".join(uri_parts))
             if addr_params:
-                addr.params = parse_params(";".join(addr_params))
+                params = parse_params(";".join(addr_params))
         else:
-            addr.uri = parse_uri(s)
+            uri = parse_uri(s)
 
-    return addr
+    return Address(display_name=display_name, uri=uri, params=params)
 
 
 def stringify_address(addr: Address) -> str:
@@ -441,36 +473,36 @@ def stringify_address(addr: Address) -> str:
 def parse_via(s: str) -> Via:
     """Parse a Via header value into a :class:`Via`."""
     s = s.strip()
-    via = Via()
+    protocol = "SIP/2.0"
+    transport = "UDP"
+    port: int | None = None
+    params: dict[str, str | None] = {}
 
     # "SIP/2.0/UDP host:port;params"
-    # Split protocol/transport from sent-by
-    slash_count = 0
-    for i, ch in enumerate(s):
-        if ch == "/":
-            slash_count += 1
-        if slash_count == 2:
-            # find the space after transport
-            space_idx = s.find(" ", i)
-            if space_idx != -1:
-                proto_part = s[:space_idx]
-                rest = s[space_idx + 1 :].strip()
-            else:
-                proto_part = s
-                rest = ""
-            # parse protocol and transport
-            proto_parts = proto_part.split("/")
-            if len(proto_parts) >= 3:
-                via.protocol = f"{proto_parts[0]}/{proto_parts[1]}"
-                via.transport = proto_parts[2].upper()
-            break
+    # Split protocol/transport from sent-by: locate the second slash, then
+    # the space that ends the transport token.
+    first_slash = s.find("/")
+    second_slash = s.find("/", first_slash + 1) if first_slash != -1 else -1
+    if second_slash != -1:
+        space_idx = s.find(" ", second_slash)
+        if space_idx != -1:
+            proto_part = s[:space_idx]
+            rest = s[space_idx + 1 :].strip()
+        else:
+            proto_part = s
+            rest = ""
+        # parse protocol and transport
+        proto_parts = proto_part.split("/")
+        if len(proto_parts) >= 3:
+            protocol = f"{proto_parts[0]}/{proto_parts[1]}"
+            transport = proto_parts[2].upper()
     else:
         rest = s
 
     # sent-by and params
     if ";" in rest:
         sentby, _, param_str = rest.partition(";")
-        via.params = parse_params(param_str)
+        params = parse_params(param_str)
     else:
         sentby = rest
 
@@ -478,23 +510,50 @@ def parse_via(s: str) -> Via:
     if sentby.startswith("["):
         bracket_end = sentby.find("]")
         if bracket_end != -1:
-            via.host = sentby[: bracket_end + 1]
+            host = sentby[: bracket_end + 1]
             after = sentby[bracket_end + 1 :]
             if after.startswith(":"):
-                via.port = int(after[1:])
+                port = int(after[1:])
         else:
-            via.host = sentby
+            host = sentby
     elif ":" in sentby:
         host_part, _, port_part = sentby.rpartition(":")
-        via.host = host_part
+        host = host_part
         try:
-            via.port = int(port_part)
+            port = int(port_part)
         except ValueError:
-            via.host = sentby
+            host = sentby
     else:
-        via.host = sentby
+        host = sentby
+
+    return Via(protocol=protocol, transport=transport, host=host, port=port, params=params)
 
-    return via
+
+def parse_via_list(s: str) -> list[Via]:
+    """Parse a Via header value that may carry several comma-separated hops.
+
+    Meant for raw, un-split input; :class:`~aiosipua.message.SipMessage`
+    already splits Via lines at parse time.  Commas inside quoted parameter
+    values are not treated as separators.
+    """
+    if '"' not in s:
+        return [parse_via(part) for part in s.split(",") if part and not part.isspace()]
+
+    vias: list[Via] = []
+    start = 0
+    in_quotes = False
+    for i, ch in enumerate(s):
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch == "," and not in_quotes:
+            part = s[start:i]
+            if part and not part.isspace():
+                vias.append(parse_via(part))
+            start = i + 1
+    tail = s[start:]
+    if tail and not tail.isspace():
+        vias.append(parse_via(tail))
+    return vias
 
 
 def stringify_via(via: Via) -> str:
@@ -543,40 +602,72 @@ def parse_auth(s: str, *, credentials: bool = False) -> AuthChallenge | AuthCred
         scheme = s[:space_idx]
         param_str = s[space_idx + 1 :]
 
-    params: dict[str, str] = {}
-    # Parse comma-separated key=value pairs, values may be quoted
-    if param_str:
-        for part in _split_auth_params(param_str):
-            part = part.strip()
-            if "=" in part:
-                key, _, val = part.partition("=")
-                val = val.strip()
-                if val.startswith('"') and val.endswith('"'):
-                    val = val[1:-1]
-                params[key.strip()] = val
+    params = _parse_auth_params(param_str) if param_str else {}
 
     if credentials:
         return AuthCredentials(scheme=scheme, params=params)
     return AuthChallenge(scheme=scheme, params=params)
 
 
-def _split_auth_params(s: str) -> list[str]:
-    """Split auth params on commas, respecting quoted strings."""
-    parts: list[str] = []
-    current: list[str] = []
-    in_quotes = False
-    for ch in s:
-        if ch == '"':
-            in_quotes = not in_quotes
-            current.append(ch)
-        elif ch == "," and not in_quotes:
-            parts.append("".join(current))
-            current = []
+def _parse_auth_params(s: str) -> dict[str, str]:
+    """Parse comma-separated ``key=value`` auth params in a single pass.
+
+    Quoted values may contain commas and backslash escapes (RFC 3261
+    ``quoted-pair``).  Every character is visited at most once, so hostile
+    input with long runs of backslashes or unbalanced quotes stays linear.
+    """
+    params: dict[str, str] = {}
+    n = len(s)
+    i = 0
+    eq = -1
+    while i < n:
+        # Skip separators between params
+        while i < n and s[i] in " \t,":
+            i += 1
+        if i >= n:
+            break
+
+        if eq < i:
+            eq = s.find("=", i)
+            if eq == -1:
+                break
+        comma = s.find(",", i, eq)
+        if comma != -1:
+            # Valueless token — ignore up to the next separator
+            i = comma + 1
+            continue
+        key = s[i:eq].strip()
+        i = eq + 1
+        while i < n and s[i] in " \t":
+            i += 1
+
+        if i < n and s[i] == '"':
+            # Quoted string: scan to the closing quote, unescaping quoted-pairs
+            i += 1
+            chars: list[str] = []
+            while i < n:
+                ch = s[i]
+                if ch == "\\" and i + 1 < n:
+                    chars.append(s[i + 1])
+                    i += 2
+                    continue
+                if ch == '"':
+                    i += 1
+                    break
+                chars.append(ch)
+                i += 1
+            val = "".join(chars)
+            comma = s.find(",", i)
+            i = n if comma == -1 else comma + 1
         else:
-            current.append(ch)
-    if current:
-        parts.append("".join(current))
-    return parts
+            end = s.find(",", i)
+            if end == -1:
+                end = n
+            val = s[i:end].strip()
+            i = end + 1
+
+        params[key] = val
+    return params
 
 
 def stringify_auth(auth: AuthChallenge | AuthCredentials) -> str:
@@ -584,7 +675,8 @@ def stringify_auth(auth: AuthChallenge | AuthCredentials) -> str:
     parts: list[str] = []
     for key, val in auth.params.items():
         if val and (not val.isdigit() and val.lower() not in ("true", "false")):
-            parts.append(f'{key}="{val}"')
+            quoted = val.replace("\\", "\\\\").replace('"', '\\"')
+            parts.append(f'{key}="{quoted}"')
         else:
             parts.append(f"{key}={val}")
     return f"{auth.scheme} {', '.join(parts)}"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar, Literal, TypeVar
 
 from .headers import (
     MULTI_INSTANCE_HEADERS,
@@ -20,6 +21,11 @@ from .headers import (
     stringify_via,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_T = TypeVar("_T")
+
 
 def _split_multi_value(s: str) -> list[str]:
     """Split a header value on commas, respecting angle brackets and quotes.
@@ -54,9 +60,59 @@ def _split_multi_value(s: str) -> list[str]:
     return parts
 
 
-@dataclass
+def parse_content_length(head: bytes) -> int:
+    """Return the Content-Length (or compact ``l``) value from a raw header section.
+
+    Missing or malformed values count as ``0``.
+    """
+    for line in head.split(b"\r\n"):
+        name, sep, value = line.partition(b":")
+        if sep and name.strip().lower() in (b"content-length", b"l"):
+            try:
+                return max(int(value.strip()), 0)
+            except ValueError:
+                return 0
+    return 0
+
+
+def _add_header_line(headers: CaseInsensitiveDict, line: str) -> None:
+    """Parse one unfolded ``Name: value`` line into *headers*."""
+    colon_idx = line.find(":")
+    if colon_idx == -1:
+        return
+    name = line[:colon_idx].strip()
+    value = line[colon_idx + 1 :].strip()
+
+    # Expand compact headers
+    name = expand_compact_header(name)
+
+    # Split multi-value headers
+    if name.lower() in MULTI_INSTANCE_HEADERS:
+        for val in _split_multi_value(value):
+            headers.append(name, val)
+    else:
+        headers.append(name, value)
+
+
+def _parse_optional(
+    headers: CaseInsensitiveDict, name: str, parse: Callable[[str], _T]
+) -> _T | None:
+    """Parse the first value of header *name*, or return ``None`` if absent/empty."""
+    raw = headers.get_first(name)
+    return parse(raw) if raw else None
+
+
+@dataclass(slots=True)
 class SipMessage:
-    """Base class for SIP messages."""
+    """Base class for SIP messages.
+
+    Subclasses set :attr:`kind` to :attr:`KIND_REQUEST` or
+    :attr:`KIND_RESPONSE` so dispatchers can branch on a plain integer
+    compare instead of an ``isinstance`` check.
+    """
+
+    KIND_REQUEST: ClassVar[Literal[0]] = 0
+    KIND_RESPONSE: ClassVar[Literal[1]] = 1
 
     headers: CaseInsensitiveDict = field(default_factory=CaseInsensitiveDict)
     body: str = ""
@@ -65,52 +121,103 @@ class SipMessage:
     def parse(data: str) -> SipRequest | SipResponse:
         """Parse a raw SIP message string into a typed message object."""
         # Split headers from body, preserving body content as-is
-        if "\r\n\r\n" in data:
-            header_section, _, body = data.partition("\r\n\r\n")
-        elif "\n\n" in data:
-            header_section, _, body = data.partition("\n\n")
+        sep = data.find("\r\n\r\n")
+        if sep != -1:
+            header_section, body = data[:sep], data[sep + 4 :]
         else:
-            header_section = data
-            body = ""
+            sep = data.find("\n\n")
+            if sep != -1:
+                header_section, body = data[:sep], data[sep + 2 :]
+            else:
+                header_section, body = data, ""
+        return SipMessage._parse_sections(header_section, body)
+
+    @staticmethod
+    def parse_bytes(data: bytes) -> SipRequest | SipResponse:
+        """Parse raw SIP wire bytes into a typed message object.
+
+        The header/body boundary is located on the raw bytes, so only the
+        two sections are decoded rather than the whole datagram being
+        decoded and then scanned again as text.
+        """
+        sep = data.find(b"\r\n\r\n")
+        if sep != -1:
+            head, body = data[:sep], data[sep + 4 :]
+        else:
+            sep = data.find(b"\n\n")
+            if sep != -1:
+                head, body = data[:sep], data[sep + 2 :]
+            else:
+                head, body = data, b""
+        return SipMessage._parse_sections(
+            head.decode("utf-8", errors="replace"),
+            body.decode("utf-8", errors="replace") if body else "",
+        )
 
-        # Normalize line endings in header section only
-        header_section = header_section.replace("\r\n", "\n").replace("\r", "\n")
-        lines = header_section.split("\n")
+    @staticmethod
+    def parse_many(data: bytes) -> list[SipRequest | SipResponse]:
+        """Parse a buffer holding several back-to-back SIP messages.
+
+        Messages are framed as on a stream transport (RFC 3261 §18.3): the
+        header section ends at the first blank line and the body is exactly
+        ``Content-Length`` bytes.  CRLF keep-alives between messages are
+        skipped; a trailing incomplete message is ignored.
+        """
+        messages: list[SipRequest | SipResponse] = []
+        pos = 0
+        n = len(data)
+        while pos < n:
+            while data.startswith(b"\r\n", pos):
+                pos += 2
+            sep = data.find(b"\r\n\r\n", pos)
+            if sep == -1:
+                break
+            head = data[pos:sep]
+            body_start = sep + 4
+            end = body_start + parse_content_length(head)
+            if end > n:
+                break
+            body = data[body_start:end]
+            messages.append(
+                SipMessage._parse_sections(
+                    head.decode("utf-8", errors="replace"),
+                    body.decode("utf-8", errors="replace") if body else "",
+                )
+            )
+            pos = end
+        return messages
+
+    @staticmethod
+    def _parse_sections(header_section: str, body: str) -> SipRequest | SipResponse:
+        """Build a message from an already-split header section and body."""
+        # Split on CRLF in one pass; only normalize when bare CR or LF are present
+        lines = header_section.split("\r\n")
+        crlf_count = len(lines) - 1
+        if header_section.count("\n") != crlf_count or header_section.count("\r") != crlf_count:
+            header_section = header_section.replace("\r\n", "\n").replace("\r", "\n")
+            lines = header_section.split("\n")
         if not lines:
             raise ValueError("Empty SIP message")
 
         start_line = lines[0].strip()
 
-        # Unfold continuation lines (RFC 3261 §7.3.1)
-        header_lines: list[str] = []
+        # Unfold continuation lines (RFC 3261 §7.3.1) and parse in one pass:
+        # a header line is only parsed once the next non-continuation line
+        # shows it is complete.
+        headers = CaseInsensitiveDict()
+        pending: str | None = None
         for line in lines[1:]:
             if not line:
                 continue
-            if line[0] in (" ", "\t") and header_lines:
+            if pending is not None and line[0] in " \t":
                 # Continuation of previous header
-                header_lines[-1] += " " + line.strip()
-            else:
-                header_lines.append(line)
-
-        # Parse headers
-        headers = CaseInsensitiveDict()
-        for line in header_lines:
-            colon_idx = line.find(":")
-            if colon_idx == -1:
+                pending += " " + line.strip()
                 continue
-            name = line[:colon_idx].strip()
-            value = line[colon_idx + 1 :].strip()
-
-            # Expand compact headers
-            name = expand_compact_header(name)
-
-            # Split multi-value headers
-            lower = name.lower()
-            if lower in MULTI_INSTANCE_HEADERS:
-                for val in _split_multi_value(value):
-                    headers.append(name, val)
-            else:
-                headers.append(name, value)
+            if pending is not None:
+                _add_header_line(headers, pending)
+            pending = line
+        if pending is not None:
+            _add_header_line(headers, pending)
 
         # Detect request vs response
         if start_line.startswith("SIP/"):
@@ -130,11 +237,16 @@ class SipMessage:
 
     def serialize(self) -> str:
         """Serialize the message back to a SIP wire-format string."""
+        headers = self.headers
         lines: list[str] = [self._start_line()]
 
-        # Auto-set Content-Length
-        body_bytes = self.body.encode("utf-8") if self.body else b""
-        self.headers.set_single("Content-Length", str(len(body_bytes)))
+        # Auto-set Content-Length.  ASCII bodies (e.g. SDP) need no encode to
+        # measure, and the header is only rewritten when the value changed.
+        body = self.body
+        body_len = len(body) if body.isascii() else len(body.encode("utf-8"))
+        content_length = str(body_len)
+        if headers.get("content-length") != [content_length]:
+            headers.set_single("Content-Length", content_length)
 
         for name, values in self.headers.items():
             pretty = prettify_header_name(name)
@@ -193,8 +305,7 @@ class SipMessage:
     @property
     def from_addr(self) -> Address | None:
         """The From header, parsed into an :class:`Address`."""
-        raw = self.headers.get_first("from")
-        return parse_address(raw) if raw else None
+        return _parse_optional(self.headers, "from", parse_address)
 
     @from_addr.setter
     def from_addr(self, addr: Address) -> None:
@@ -203,8 +314,7 @@ class SipMessage:
     @property
     def to_addr(self) -> Address | None:
         """The To header, parsed into an :class:`Address`."""
-        raw = self.headers.get_first("to")
-        return parse_address(raw) if raw else None
+        return _parse_optional(self.headers, "to", parse_address)
 
     @to_addr.setter
     def to_addr(self, addr: Address) -> None:
@@ -213,8 +323,7 @@ class SipMessage:
     @property
     def cseq(self) -> CSeq | None:
         """The CSeq header, parsed into a :class:`CSeq`."""
-        raw = self.headers.get_first("cseq")
-        return parse_cseq(raw) if raw else None
+        return _parse_optional(self.headers, "cseq", parse_cseq)
 
     @cseq.setter
     def cseq(self, cseq: CSeq) -> None:
@@ -260,10 +369,12 @@ class SipMessage:
         self.headers.set_single("Content-Length", str(value))
 
 
-@dataclass
+@dataclass(slots=True)
 class SipRequest(SipMessage):
     """A SIP request message."""
 
+    kind: ClassVar[Literal[0]] = 0
+
     method: str = ""
     uri: str = ""
 
@@ -271,10 +382,12 @@ class SipRequest(SipMessage):
         return f"{self.method} {self.uri} SIP/2.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class SipResponse(SipMessage):
     """A SIP response message."""
 
+    kind: ClassVar[Literal[1]] = 1
+
     status_code: int = 0
     reason_phrase: str = ""
 
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
-from .message import SipMessage, SipRequest, SipResponse
+from .message import SipMessage, SipRequest, SipResponse, parse_content_length
 
 logger = logging.getLogger(__name__)
 
@@ -73,8 +72,7 @@ class SipTransport:
     def _dispatch(self, data: bytes, addr: tuple[str, int]) -> None:
         """Parse raw bytes and dispatch to callback."""
         try:
-            text = data.decode("utf-8", errors="replace")
-            msg = SipMessage.parse(text)
+            msg = SipMessage.parse_bytes(data)
         except Exception:
             logger.warning("Failed to parse SIP message from %s", addr, exc_info=True)
             return
@@ -246,15 +244,7 @@ async def _read_sip_message(reader: asyncio.StreamReader) -> bytes | None:
             break
 
     # Parse Content-Length from headers
-    content_length = 0
-    header_text = header_buf.decode("utf-8", errors="replace")
-    for hdr_line in header_text.split("\r\n"):
-        lower = hdr_line.lower()
-        if lower.startswith("content-length:") or lower.startswith("l:"):
-            _, _, val = hdr_line.partition(":")
-            with contextlib.suppress(ValueError):
-                content_length = int(val.strip())
-            break
+    content_length = parse_content_length(bytes(header_buf))
 
     # Read body
     if content_length > 0:
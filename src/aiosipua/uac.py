@@ -18,6 +18,16 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from .dialog import Dialog, DialogState
+from .headers import (
+    AuthCredentials,
+    CSeq,
+    Via,
+    parse_auth,
+    stringify_auth,
+    stringify_cseq,
+    stringify_via,
+)
+from .message import SipRequest
 from .sdp import SdpMessage, parse_sdp, serialize_sdp
 from .transaction import TransactionLayer
 from .utils import generate_branch, generate_call_id, generate_tag
@@ -25,8 +35,7 @@ from .utils import generate_branch, generate_call_id, generate_tag
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    from .headers import AuthCredentials
-    from .message import SipRequest, SipResponse
+    from .message import SipResponse
     from .transport import SipTransport
 
 logger = logging.getLogger(__name__)
@@ -188,8 +197,6 @@ class SipUAC:
         Returns:
             An :class:`OutgoingCall` that can be used to await the response.
         """
-        from .message import SipRequest
-
         addr = self._local_addr()
         domain = addr[0]
         call_id = generate_call_id(domain)
@@ -211,9 +218,6 @@ class SipUAC:
         # Build INVITE request — use dialog.next_cseq() for proper CSeq
         cseq_num = dialog.next_cseq()
 
-        from .headers import CSeq as CSeqObj
-        from .headers import Via, stringify_cseq, stringify_via
-
         invite = SipRequest(method="INVITE", uri=to_uri)
 
         # Via
@@ -236,7 +240,7 @@ class SipUAC:
 
         # CSeq
         invite.headers.set_single(
-            "CSeq", stringify_cseq(CSeqObj(seq=cseq_num, method="INVITE"))
+            "CSeq", stringify_cseq(CSeq(seq=cseq_num, method="INVITE"))
         )
 
         # Max-Forwards
@@ -544,8 +548,6 @@ class SipUAC:
         status: int,
     ) -> bool:
         """Handle a 401/407 auth challenge. Returns True if retry was sent."""
-        from .headers import AuthCredentials, parse_auth
-
         # Pick the right challenge header
         header_name = "WWW-Authenticate" if status == 401 else "Proxy-Authenticate"
         challenge_str = response.get_header(header_name)
@@ -597,10 +599,6 @@ class SipUAC:
         auth_header_name: str,
     ) -> None:
         """Re-send INVITE with auth credentials (RFC 3261 §22.2)."""
-        from .headers import CSeq as CSeqObj
-        from .headers import Via, stringify_auth, stringify_cseq, stringify_via
-        from .message import SipRequest
-
         addr = self._local_addr()
         branch = generate_branch()
         cseq_num = call.dialog.next_cseq()
@@ -629,7 +627,7 @@ class SipUAC:
 
         # CSeq — incremented
         invite.headers.set_single(
-            "CSeq", stringify_cseq(CSeqObj(seq=cseq_num, method="INVITE"))
+            "CSeq", stringify_cseq(CSeq(seq=cseq_num, method="INVITE"))
         )
 
         # Max-Forwards
@@ -640,8 +638,6 @@ class SipUAC:
 
         # SDP body (same as original)
         if call.sdp_offer is not None:
-            from .sdp import serialize_sdp
-
             invite.body = serialize_sdp(call.sdp_offer)
             invite.headers.set_single("Content-Type", "application/sdp")
 
@@ -665,10 +661,6 @@ class SipUAC:
         ACK for 2xx is a new transaction (new branch) but uses the
         same CSeq number as the original INVITE.
         """
-        from .headers import CSeq as CSeqObj
-        from .headers import Via, stringify_cseq, stringify_via
-        from .message import SipRequest
-
         addr = self._local_addr()
         branch = generate_branch()
 
@@ -706,7 +698,7 @@ class SipUAC:
 
         # CSeq — same number as INVITE, method=ACK
         ack.headers.set_single(
-            "CSeq", stringify_cseq(CSeqObj(seq=cseq_num, method="ACK"))
+            "CSeq", stringify_cseq(CSeq(seq=cseq_num, method="ACK"))
         )
 
         # Max-Forwards
@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from .dialog import Dialog, DialogState, _default_reason, create_dialog_from_request
-from .message import SipRequest, SipResponse
+from .message import SipMessage, SipRequest, SipResponse
 from .sdp import SdpMessage, parse_sdp, serialize_sdp
 from .transaction import TransactionLayer
 from .utils import generate_tag
@@ -242,9 +242,9 @@ class SipUAS:
 
     def _on_message(self, msg: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
         """Internal message handler dispatched by the transport."""
-        if isinstance(msg, SipRequest):
+        if msg.kind == SipMessage.KIND_REQUEST:
             self._handle_request(msg, addr)
-        elif isinstance(msg, SipResponse) and self.uac is not None:
+        elif self.uac is not None:
             self.uac.handle_response(msg, addr)
 
     def _handle_request(self, request: SipRequest, addr: tuple[str, int]) -> None:
@@ -0,0 +1,80 @@
+"""Shared fixtures for the UAC and UAS tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from aiosipua.message import SipMessage
+from aiosipua.uas import SipUAS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from aiosipua.message import SipRequest, SipResponse
+
+LOCAL_ADDR = ("10.0.0.2", 5060)
+REMOTE_ADDR = ("10.0.0.1", 5060)
+
+
+class FakeTransport:
+    """Minimal SipTransport stand-in that captures sent messages."""
+
+    __slots__ = ("local_addr", "on_message", "sent", "_started")
+
+    def __init__(self, local_addr: tuple[str, int] = LOCAL_ADDR) -> None:
+        self.local_addr = local_addr
+        self.on_message = None
+        self.sent: list[tuple[SipRequest | SipResponse, tuple[str, int]]] = []
+        self._started = False
+
+    async def start(self) -> None:
+        self._started = True
+
+    async def stop(self) -> None:
+        self._started = False
+
+    def send(self, message: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
+        self.sent.append((message, addr))
+
+    def send_reply(self, response: SipResponse) -> None:
+        # In the real transport this uses Via routing; for testing just
+        # store it with a dummy addr.
+        self.sent.append((response, ("0.0.0.0", 0)))
+
+    def inject(
+        self,
+        raw: str | SipRequest | SipResponse,
+        addr: tuple[str, int] = REMOTE_ADDR,
+    ) -> None:
+        """Simulate receiving a SIP message (raw text or already parsed)."""
+        msg = SipMessage.parse(raw) if isinstance(raw, str) else raw
+        if self.on_message is not None:
+            self.on_message(msg, addr)
+
+    def reset(self) -> None:
+        """Return to the freshly constructed state so the instance can be reused."""
+        self.sent.clear()
+        self.on_message = None
+        self._started = False
+
+
+@pytest.fixture(scope="module")
+def shared_transport() -> FakeTransport:
+    return FakeTransport()
+
+
+@pytest.fixture()
+def transport(shared_transport: FakeTransport) -> Iterator[FakeTransport]:
+    """The module's FakeTransport, reset after each test instead of reallocated."""
+    yield shared_transport
+    shared_transport.reset()
+
+
+@pytest.fixture()
+def wired_uas(transport: FakeTransport) -> tuple[SipUAS, FakeTransport]:
+    """A SipUAS whose fake transport delivers injected messages to it, as start() would."""
+    uas = SipUAS(transport)  # type: ignore[arg-type]
+    transport.on_message = uas._on_message
+    return uas, transport
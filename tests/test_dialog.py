@@ -179,6 +179,15 @@ class TestDialogCreateRequest:
         assert c1 is not None and c2 is not None
         assert c2.seq == c1.seq + 1
 
+    def test_remote_tag_change_updates_to(self) -> None:
+        invite = _make_invite()
+        dialog = create_dialog_from_request(invite, local_tag="bbb")
+        dialog.create_request("INFO")
+        dialog.remote_tag = "zzz"
+        to_val = dialog.create_request("INFO").get_header("to")
+        assert to_val is not None
+        assert to_val.endswith(";tag=zzz")
+
 
 class TestDialogCreateResponse:
     def test_200_ok(self) -> None:
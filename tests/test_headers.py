@@ -14,8 +14,10 @@ from aiosipua.headers import (
     parse_params,
     parse_uri,
     parse_via,
+    parse_via_list,
     prettify_header_name,
     stringify_address,
+    stringify_auth,
     stringify_cseq,
     stringify_uri,
     stringify_via,
@@ -74,6 +76,13 @@ class TestCaseInsensitiveDict:
         assert d.get_first("missing") is None
         assert d.get_first("missing", "fallback") == "fallback"
 
+    def test_keys_shared_across_spellings(self) -> None:
+        d = CaseInsensitiveDict()
+        d.set_single("CALL-ID", "abc")
+        d.set_single("call-id", "def")
+        assert len(d) == 1
+        assert d.get_first("Call-ID") == "def"
+
 
 class TestCompactHeaders:
     def test_expand_known(self) -> None:
@@ -254,6 +263,19 @@ class TestVia:
         via.branch = None
         assert via.branch is None
 
+    def test_parse_list(self) -> None:
+        vias = parse_via_list("SIP/2.0/UDP a.example.com;branch=z9hG4bK1, SIP/2.0/TCP b:5061")
+        assert [(v.host, v.transport, v.port) for v in vias] == [
+            ("a.example.com", "UDP", None),
+            ("b", "TCP", 5061),
+        ]
+
+    def test_parse_list_quoted_comma(self) -> None:
+        vias = parse_via_list('SIP/2.0/UDP a;x="1,2", SIP/2.0/UDP b')
+        assert len(vias) == 2
+        assert vias[0].params["x"] == '"1,2"'
+        assert vias[1].host == "b"
+
 
 class TestCSeq:
     def test_parse(self) -> None:
@@ -285,3 +307,22 @@ class TestAuth:
         assert auth.scheme == "Digest"
         assert auth.params["username"] == "alice"
         assert auth.params["response"] == "def456"
+
+    def test_quoted_comma_and_escape(self) -> None:
+        s = r'Digest realm="a, b", nonce="x\"y", qop="auth"'
+        auth = parse_auth(s)
+        assert auth.params["realm"] == "a, b"
+        assert auth.params["nonce"] == 'x"y'
+        assert auth.params["qop"] == "auth"
+
+    def test_unterminated_quote(self) -> None:
+        s = 'Digest realm="' + "\\" * 10000
+        auth = parse_auth(s)
+        assert auth.params["realm"] == "\\" * 5000
+
+    def test_escaped_values_round_trip(self) -> None:
+        s = r'Digest realm="a\"b", nonce="c\\d"'
+        auth = parse_auth(s)
+        assert auth.params == {"realm": 'a"b', "nonce": "c\\d"}
+        assert stringify_auth(auth) == s
+        assert parse_auth(stringify_auth(auth)).params == auth.params
@@ -49,6 +49,10 @@ class TestParseRequest:
         assert msg.method == "INVITE"
         assert msg.uri == "sip:bob@biloxi.example.com"
 
+    def test_invite_kind(self) -> None:
+        msg = SipMessage.parse(INVITE)
+        assert msg.kind == SipMessage.KIND_REQUEST
+
     def test_invite_headers(self) -> None:
         msg = SipMessage.parse(INVITE)
         assert msg.get_header("Max-Forwards") == "70"
@@ -95,6 +99,10 @@ class TestParseRequest:
 
 
 class TestParseResponse:
+    def test_response_kind(self) -> None:
+        msg = SipMessage.parse(OK_200)
+        assert msg.kind == SipMessage.KIND_RESPONSE
+
     def test_200_ok(self) -> None:
         msg = SipMessage.parse(OK_200)
         assert isinstance(msg, SipResponse)
@@ -121,6 +129,48 @@ class TestParseResponse:
         assert msg.reason_phrase == "Trying"
 
 
+class TestSlots:
+    def test_no_instance_dict(self) -> None:
+        msg = SipMessage.parse(INVITE)
+        assert not hasattr(msg, "__dict__")
+        assert not hasattr(msg.via[0], "__dict__")
+        assert msg.from_addr is not None
+        assert not hasattr(msg.from_addr, "__dict__")
+
+
+class TestParseBytes:
+    def test_matches_str_parse(self) -> None:
+        from_str = SipMessage.parse(INVITE)
+        from_bytes = SipMessage.parse_bytes(INVITE.encode())
+        assert isinstance(from_bytes, SipRequest)
+        assert from_bytes.serialize() == from_str.serialize()
+
+    def test_body_decoded(self) -> None:
+        raw = OK_200.replace("Content-Length: 0", "Content-Length: 5") + "héllo"
+        msg = SipMessage.parse_bytes(raw.encode())
+        assert msg.body == "héllo"
+
+
+class TestParseMany:
+    def test_back_to_back_messages(self) -> None:
+        with_body = OK_200.replace("Content-Length: 0", "Content-Length: 4") + "abcd"
+        data = (INVITE + "\r\n" + with_body + TRYING_100).encode()
+        msgs = SipMessage.parse_many(data)
+        assert [m.kind for m in msgs] == [
+            SipMessage.KIND_REQUEST,
+            SipMessage.KIND_RESPONSE,
+            SipMessage.KIND_RESPONSE,
+        ]
+        assert msgs[1].body == "abcd"
+        assert isinstance(msgs[2], SipResponse)
+        assert msgs[2].status_code == 100
+
+    def test_incomplete_tail_ignored(self) -> None:
+        truncated = OK_200.replace("Content-Length: 0", "Content-Length: 10") + "abc"
+        msgs = SipMessage.parse_many((INVITE + truncated).encode())
+        assert len(msgs) == 1
+
+
 class TestCompactHeaders:
     def test_compact_via(self) -> None:
         raw = (
@@ -170,6 +220,15 @@ class TestLineFolding:
         msg = SipMessage.parse(raw)
         assert msg.get_header("Subject") == "This is a long subject line"
 
+    def test_bare_lf_line_endings(self) -> None:
+        raw = (
+            "INVITE sip:bob@example.com SIP/2.0\nSubject: a\n b\nCall-ID: x\r\nCSeq: 1 INVITE\n\n"
+        )
+        msg = SipMessage.parse(raw)
+        assert msg.get_header("Subject") == "a b"
+        assert msg.call_id == "x"
+        assert msg.get_header("CSeq") == "1 INVITE"
+
 
 class TestSerialize:
     def test_request_roundtrip(self) -> None:
@@ -194,12 +253,30 @@ class TestSerialize:
         body_len = len(msg.body.encode("utf-8"))
         assert f"Content-Length: {body_len}" in serialized
 
+    def test_content_length_counts_utf8_bytes(self) -> None:
+        msg = SipMessage.parse(INVITE)
+        msg.body = "héllo"
+        assert "Content-Length: 6\r\n" in msg.serialize()
+
+    def test_correct_content_length_left_untouched(self) -> None:
+        msg = SipMessage.parse(INVITE)
+        before = msg.headers.get("content-length")
+        msg.serialize()
+        assert msg.headers.get("content-length") is before
+
     def test_bytes(self) -> None:
         msg = SipMessage.parse(INVITE)
         raw_bytes = bytes(msg)
         assert isinstance(raw_bytes, bytes)
         assert raw_bytes.startswith(b"INVITE")
 
+    def test_in_place_header_edits_are_serialized(self) -> None:
+        msg = SipMessage.parse(INVITE)
+        msg.serialize()
+        msg.get_header_values("Via").insert(0, "SIP/2.0/UDP 10.0.0.1;branch=z9hG4bKx")
+        assert len(msg.via) == 2
+        assert "Via: SIP/2.0/UDP 10.0.0.1;branch=z9hG4bKx\r\n" in msg.serialize()
+
 
 class TestModifyAndReserialize:
     def test_add_via(self) -> None:
@@ -233,6 +310,49 @@ class TestModifyAndReserialize:
         assert msg.cseq.seq == 2
 
 
+class TestStructuredAccessors:
+    def test_editing_returned_address_does_not_leak(self) -> None:
+        msg = SipMessage.parse(OK_200)
+        to_addr = msg.to_addr
+        assert to_addr is not None
+        to_addr.params["tag"] = "changed"
+        to_addr.uri.params["transport"] = "tcp"
+        to = msg.to_addr
+        assert to is not None
+        assert to.tag == "a6c85cf"
+        assert "transport" not in to.uri.params
+        assert msg.contact[0] is not msg.contact[0]
+
+    def test_editing_returned_via_and_cseq_does_not_leak(self) -> None:
+        msg = SipMessage.parse(INVITE)
+        msg.via[0].params["received"] = "192.0.2.9"
+        cseq = msg.cseq
+        assert cseq is not None
+        cseq.seq = 99
+        assert "received" not in msg.via[0].params
+        assert msg.cseq is not None
+        assert msg.cseq.seq == 314159
+
+    def test_list_accessor_returns_copy(self) -> None:
+        msg = SipMessage.parse(OK_200)
+        vias = msg.via
+        vias.pop()
+        assert len(msg.via) == 2
+
+    def test_set_header_updates_accessor(self) -> None:
+        msg = SipMessage.parse(INVITE)
+        assert msg.cseq is not None
+        msg.set_header("CSeq", "7 BYE")
+        assert msg.cseq is not None
+        assert msg.cseq.seq == 7
+
+    def test_direct_header_mutation_updates_accessor(self) -> None:
+        msg = SipMessage.parse(INVITE)
+        assert len(msg.via) == 1
+        msg.headers.append("Via", "SIP/2.0/UDP proxy.example.com;branch=z9hG4bKx")
+        assert len(msg.via) == 2
+
+
 class TestXHeaders:
     def test_x_header_roundtrip(self) -> None:
         raw = (
@@ -1,8 +1,12 @@
 """Tests for SDP negotiation and high-level builder (Phase 1)."""
 
+from typing import Any
+
 import pytest
 
 from aiosipua.sdp import (
+    MediaDescription,
+    SdpMessage,
     SdpNegotiationError,
     build_sdp,
     negotiate_sdp,
@@ -142,24 +146,80 @@ TWILIO_OFFER = (
     "a=sendrecv\r\n"
 )
 
+# --- Parsed samples ---
+
+
+@pytest.fixture(scope="module")
+def carrier_offer_basic() -> SdpMessage:
+    return parse_sdp(CARRIER_OFFER_BASIC)
+
+
+@pytest.fixture(scope="module")
+def carrier_offer_pcma_first() -> SdpMessage:
+    return parse_sdp(CARRIER_OFFER_PCMA_FIRST)
+
+
+@pytest.fixture(scope="module")
+def webrtc_offer() -> SdpMessage:
+    return parse_sdp(WEBRTC_OFFER)
+
+
+@pytest.fixture(scope="module")
+def offer_no_dtmf() -> SdpMessage:
+    return parse_sdp(OFFER_NO_DTMF)
+
+
+@pytest.fixture(scope="module")
+def offer_sendonly() -> SdpMessage:
+    return parse_sdp(OFFER_SENDONLY)
+
+
+@pytest.fixture(scope="module")
+def offer_static_only() -> SdpMessage:
+    return parse_sdp(OFFER_STATIC_ONLY)
+
+
+@pytest.fixture(scope="module")
+def video_only_offer() -> SdpMessage:
+    return parse_sdp(VIDEO_ONLY_OFFER)
+
+
+@pytest.fixture(scope="module")
+def twilio_offer() -> SdpMessage:
+    return parse_sdp(TWILIO_OFFER)
+
+
+def _pt_to_codec(audio: MediaDescription) -> dict[int, str]:
+    """Map payload type to encoding name from the ``a=rtpmap`` lines of *audio*."""
+    pts: dict[int, str] = {}
+    for r in audio.attributes.get("rtpmap", ()):
+        pt, _, encoding = r.partition(" ")
+        pts[int(pt)] = encoding.split("/", 1)[0]
+    return pts
+
+
+def _audio_summary(sdp: SdpMessage) -> tuple[str, tuple[str, int] | None] | None:
+    """``(direction, rtp_address)`` of the audio stream, or ``None`` without one."""
+    audio = sdp.audio
+    return (audio.direction, sdp.rtp_address) if audio is not None else None
+
 
 class TestNegotiateBasic:
-    def test_choose_pcmu(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
+    def test_choose_pcmu(self, carrier_offer_basic: SdpMessage) -> None:
         answer, chosen_pt = negotiate_sdp(
-            offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
+            carrier_offer_basic, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
         )
         assert chosen_pt == 0
         assert answer.audio is not None
         assert answer.audio.port == 30000
         assert "0" in answer.audio.formats
         # Verify answer includes rtpmap for chosen codec
-        rtpmaps = answer.audio.attributes.get("rtpmap", [])
-        assert any("PCMU" in r for r in rtpmaps)
+        assert _pt_to_codec(answer.audio).get(0) == "PCMU"
 
-    def test_answer_structure(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
-        answer, _ = negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999")
+    def test_answer_structure(self, carrier_offer_basic: SdpMessage) -> None:
+        answer, _ = negotiate_sdp(
+            carrier_offer_basic, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
+        )
         assert answer.version == 0
         assert answer.origin.address == "10.0.0.5"
         assert answer.origin.session_id == "99999"
@@ -169,48 +229,41 @@ class TestNegotiateBasic:
 
 
 class TestCodecPreference:
-    def test_offerer_preference_wins(self) -> None:
-        """When offer lists PCMA first, PCMA should be chosen."""
-        offer = parse_sdp(CARRIER_OFFER_PCMA_FIRST)
-        answer, chosen_pt = negotiate_sdp(
-            offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
-        )
-        assert chosen_pt == 8  # PCMA
-
-    def test_restrict_supported_codecs(self) -> None:
-        """When we only support PCMA, choose PCMA even if PCMU is offered first."""
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
-        answer, chosen_pt = negotiate_sdp(
+    @pytest.mark.parametrize(
+        ("offer_fixture", "supported", "expected_pt"),
+        [
+            # Offerer preference wins: PCMA listed first
+            ("carrier_offer_pcma_first", None, 8),
+            # Only PCMA supported, even though PCMU is offered first
+            ("carrier_offer_basic", [8], 8),
+            # PCMU: first in offer and in the default supported set
+            ("twilio_offer", None, 0),
+            ("twilio_offer", [18], 18),
+        ],
+        ids=["offerer-preference", "restricted-supported", "twilio-first-match", "g729"],
+    )
+    def test_codec_choice(
+        self,
+        request: pytest.FixtureRequest,
+        offer_fixture: str,
+        supported: list[int] | None,
+        expected_pt: int,
+    ) -> None:
+        offer = request.getfixturevalue(offer_fixture)
+        _, chosen_pt = negotiate_sdp(
             offer,
             local_ip="10.0.0.5",
             rtp_port=30000,
-            supported_codecs=[8],
+            supported_codecs=supported,
             session_id="99999",
         )
-        assert chosen_pt == 8
-
-    def test_twilio_first_match(self) -> None:
-        offer = parse_sdp(TWILIO_OFFER)
-        answer, chosen_pt = negotiate_sdp(
-            offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
-        )
-        assert chosen_pt == 0  # PCMU (first in offer, in default supported)
+        assert chosen_pt == expected_pt
 
-    def test_g729_supported(self) -> None:
-        offer = parse_sdp(TWILIO_OFFER)
-        answer, chosen_pt = negotiate_sdp(
-            offer,
-            local_ip="10.0.0.5",
-            rtp_port=30000,
-            supported_codecs=[18],
-            session_id="99999",
-        )
-        assert chosen_pt == 18  # G729
-
-    def test_answer_only_includes_chosen_codec(self) -> None:
+    def test_answer_only_includes_chosen_codec(self, carrier_offer_basic: SdpMessage) -> None:
         """Answer should only include the chosen codec, not all offered codecs."""
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
-        answer, _ = negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999")
+        answer, _ = negotiate_sdp(
+            carrier_offer_basic, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
+        )
         audio = answer.audio
         assert audio is not None
         # formats should be chosen codec + dtmf only
@@ -219,51 +272,49 @@ class TestCodecPreference:
 
 
 class TestNoMatch:
-    def test_no_matching_codec(self) -> None:
-        offer = parse_sdp(WEBRTC_OFFER)
+    def test_no_matching_codec(self, webrtc_offer: SdpMessage) -> None:
         with pytest.raises(SdpNegotiationError, match="No matching codec"):
             negotiate_sdp(
-                offer,
+                webrtc_offer,
                 local_ip="10.0.0.5",
                 rtp_port=30000,
                 supported_codecs=[0, 8],
                 session_id="99999",
             )
 
-    def test_no_audio_media(self) -> None:
-        offer = parse_sdp(VIDEO_ONLY_OFFER)
+    def test_no_audio_media(self, video_only_offer: SdpMessage) -> None:
         with pytest.raises(SdpNegotiationError, match="no audio"):
-            negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999")
+            negotiate_sdp(
+                video_only_offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
+            )
 
 
 class TestDtmfNegotiation:
-    def test_dtmf_included_when_offered(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
-        answer, _ = negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999")
+    def test_dtmf_included_when_offered(self, carrier_offer_basic: SdpMessage) -> None:
+        answer, _ = negotiate_sdp(
+            carrier_offer_basic, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
+        )
         audio = answer.audio
         assert audio is not None
         # Should include telephone-event
-        rtpmaps = audio.attributes.get("rtpmap", [])
-        assert any("telephone-event" in r for r in rtpmaps)
+        assert _pt_to_codec(audio).get(101) == "telephone-event"
         # fmtp for DTMF
-        fmtps = audio.attributes.get("fmtp", [])
-        assert any("0-16" in f for f in fmtps)
+        assert "101 0-16" in audio.attributes.get("fmtp", ())
 
-    def test_dtmf_omitted_when_not_offered(self) -> None:
-        offer = parse_sdp(OFFER_NO_DTMF)
-        answer, _ = negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999")
+    def test_dtmf_omitted_when_not_offered(self, offer_no_dtmf: SdpMessage) -> None:
+        answer, _ = negotiate_sdp(
+            offer_no_dtmf, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
+        )
         audio = answer.audio
         assert audio is not None
         # Should NOT include telephone-event
-        rtpmaps = audio.attributes.get("rtpmap", [])
-        assert not any("telephone-event" in r for r in rtpmaps)
+        assert "telephone-event" not in _pt_to_codec(audio).values()
         # Only the chosen codec in formats
         assert len(audio.formats) == 1
 
-    def test_dtmf_disabled_by_caller(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
+    def test_dtmf_disabled_by_caller(self, carrier_offer_basic: SdpMessage) -> None:
         answer, _ = negotiate_sdp(
-            offer,
+            carrier_offer_basic,
             local_ip="10.0.0.5",
             rtp_port=30000,
             dtmf_payload_type=0,
@@ -271,13 +322,11 @@ class TestDtmfNegotiation:
         )
         audio = answer.audio
         assert audio is not None
-        rtpmaps = audio.attributes.get("rtpmap", [])
-        assert not any("telephone-event" in r for r in rtpmaps)
+        assert "telephone-event" not in _pt_to_codec(audio).values()
 
-    def test_custom_dtmf_payload_type(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
+    def test_custom_dtmf_payload_type(self, carrier_offer_basic: SdpMessage) -> None:
         answer, _ = negotiate_sdp(
-            offer,
+            carrier_offer_basic,
             local_ip="10.0.0.5",
             rtp_port=30000,
             dtmf_payload_type=96,
@@ -286,92 +335,82 @@ class TestDtmfNegotiation:
         audio = answer.audio
         assert audio is not None
         assert "96" in audio.formats
-        rtpmaps = audio.attributes.get("rtpmap", [])
-        assert any("96 telephone-event/8000" in r for r in rtpmaps)
+        assert _pt_to_codec(audio).get(96) == "telephone-event"
 
 
 class TestPtimeHandling:
-    def test_offer_ptime_respected(self) -> None:
-        offer = parse_sdp(OFFER_NO_DTMF)  # has a=ptime:30
-        answer, _ = negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999")
-        audio = answer.audio
-        assert audio is not None
-        ptimes = audio.attributes.get("ptime", [])
-        assert ptimes == ["30"]
-
-    def test_default_ptime_when_absent(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_PCMA_FIRST)  # no ptime
+    @pytest.mark.parametrize(
+        ("offer_fixture", "ptime", "expected"),
+        [
+            # Offer a=ptime:30 is respected
+            ("offer_no_dtmf", 20, "30"),
+            # No ptime in offer: the caller's default is used
+            ("carrier_offer_pcma_first", 20, "20"),
+            ("carrier_offer_pcma_first", 30, "30"),
+            # Offer a=ptime:20 overrides the caller's default
+            ("carrier_offer_basic", 30, "20"),
+        ],
+        ids=["offer-respected", "default-when-absent", "custom-default", "offer-overrides"],
+    )
+    def test_answer_ptime(
+        self,
+        request: pytest.FixtureRequest,
+        offer_fixture: str,
+        ptime: int,
+        expected: str,
+    ) -> None:
+        offer = request.getfixturevalue(offer_fixture)
         answer, _ = negotiate_sdp(
-            offer, local_ip="10.0.0.5", rtp_port=30000, ptime=20, session_id="99999"
+            offer, local_ip="10.0.0.5", rtp_port=30000, ptime=ptime, session_id="99999"
         )
         audio = answer.audio
         assert audio is not None
-        ptimes = audio.attributes.get("ptime", [])
-        assert ptimes == ["20"]
+        assert audio.attributes.get("ptime") == [expected]
 
-    def test_custom_default_ptime(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_PCMA_FIRST)  # no ptime
-        answer, _ = negotiate_sdp(
-            offer, local_ip="10.0.0.5", rtp_port=30000, ptime=30, session_id="99999"
-        )
-        audio = answer.audio
-        assert audio is not None
-        ptimes = audio.attributes.get("ptime", [])
-        assert ptimes == ["30"]
 
-    def test_offer_ptime_overrides_default(self) -> None:
-        """Offer ptime:20 should be used even if caller passes ptime=30."""
-        offer = parse_sdp(CARRIER_OFFER_BASIC)  # has a=ptime:20
+class TestDirectionNegotiation:
+    def test_sendrecv_to_sendrecv(self, carrier_offer_basic: SdpMessage) -> None:
+        # carrier_offer_basic is sendrecv
         answer, _ = negotiate_sdp(
-            offer, local_ip="10.0.0.5", rtp_port=30000, ptime=30, session_id="99999"
+            carrier_offer_basic, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
         )
-        audio = answer.audio
-        assert audio is not None
-        ptimes = audio.attributes.get("ptime", [])
-        assert ptimes == ["20"]
-
-
-class TestDirectionNegotiation:
-    def test_sendrecv_to_sendrecv(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_BASIC)  # sendrecv
-        answer, _ = negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999")
         assert answer.audio is not None
         assert answer.audio.direction == "sendrecv"
 
-    def test_sendonly_to_recvonly(self) -> None:
-        offer = parse_sdp(OFFER_SENDONLY)
-        answer, _ = negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999")
+    def test_sendonly_to_recvonly(self, offer_sendonly: SdpMessage) -> None:
+        answer, _ = negotiate_sdp(
+            offer_sendonly, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
+        )
         assert answer.audio is not None
         assert answer.audio.direction == "recvonly"
 
 
 class TestSessionId:
-    def test_explicit_session_id(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
-        answer, _ = negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000, session_id="42")
+    def test_explicit_session_id(self, carrier_offer_basic: SdpMessage) -> None:
+        answer, _ = negotiate_sdp(
+            carrier_offer_basic, local_ip="10.0.0.5", rtp_port=30000, session_id="42"
+        )
         assert answer.origin.session_id == "42"
         assert answer.origin.session_version == "42"
 
-    def test_auto_session_id(self) -> None:
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
-        answer, _ = negotiate_sdp(offer, local_ip="10.0.0.5", rtp_port=30000)
+    def test_auto_session_id(self, carrier_offer_basic: SdpMessage) -> None:
+        answer, _ = negotiate_sdp(carrier_offer_basic, local_ip="10.0.0.5", rtp_port=30000)
         # Should be a numeric timestamp string
-        int(answer.origin.session_id)  # should not raise
+        assert answer.origin.session_id.isdigit()
 
 
 class TestStaticPayloadTypes:
-    def test_negotiate_static_only(self) -> None:
+    def test_negotiate_static_only(self, offer_static_only: SdpMessage) -> None:
         """Offer with no rtpmap lines, only static PTs."""
-        offer = parse_sdp(OFFER_STATIC_ONLY)
         answer, chosen_pt = negotiate_sdp(
-            offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
+            offer_static_only, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
         )
         assert chosen_pt == 0
         assert answer.audio is not None
 
 
 class TestBuildSdp:
-    def test_build_pcmu(self) -> None:
+    def test_build_session_fields(self) -> None:
         sdp = build_sdp(
             local_ip="10.0.0.5",
             rtp_port=30000,
@@ -385,12 +424,37 @@ class TestBuildSdp:
         assert sdp.origin.session_id == "12345"
         assert sdp.origin.address == "10.0.0.5"
 
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            # PCMU with the default DTMF payload type 101 and ptime 20
+            (
+                {"payload_type": 0, "codec_name": "PCMU"},
+                (["0", "101"], {0: "PCMU", 101: "telephone-event"}, ["20"]),
+            ),
+            # DTMF disabled
+            (
+                {"payload_type": 8, "codec_name": "PCMA", "dtmf_payload_type": 0},
+                (["8"], {8: "PCMA"}, ["20"]),
+            ),
+            # Caller-chosen ptime
+            (
+                {"payload_type": 0, "codec_name": "PCMU", "ptime": 30},
+                (["0", "101"], {0: "PCMU", 101: "telephone-event"}, ["30"]),
+            ),
+        ],
+        ids=["pcmu", "no-dtmf", "custom-ptime"],
+    )
+    def test_build_audio(
+        self,
+        kwargs: dict[str, Any],
+        expected: tuple[list[str], dict[int, str], list[str]],
+    ) -> None:
+        sdp = build_sdp(local_ip="10.0.0.5", rtp_port=30000, session_id="12345", **kwargs)
         audio = sdp.audio
         assert audio is not None
-        assert audio.port == 30000
-        assert "0" in audio.formats
-        assert "101" in audio.formats  # default DTMF PT
-        assert audio.direction == "sendrecv"
+        assert _audio_summary(sdp) == ("sendrecv", ("10.0.0.5", 30000))
+        assert (audio.formats, _pt_to_codec(audio), audio.attributes.get("ptime")) == expected
 
     def test_build_serializes(self) -> None:
         sdp = build_sdp(
@@ -407,34 +471,6 @@ class TestBuildSdp:
         assert "a=rtpmap:0 PCMU/8000\r\n" in text
         assert "a=rtpmap:101 telephone-event/8000\r\n" in text
 
-    def test_build_no_dtmf(self) -> None:
-        sdp = build_sdp(
-            local_ip="10.0.0.5",
-            rtp_port=30000,
-            payload_type=8,
-            codec_name="PCMA",
-            dtmf_payload_type=0,
-            session_id="12345",
-        )
-        audio = sdp.audio
-        assert audio is not None
-        assert audio.formats == ["8"]
-        rtpmaps = audio.attributes.get("rtpmap", [])
-        assert not any("telephone-event" in r for r in rtpmaps)
-
-    def test_build_custom_ptime(self) -> None:
-        sdp = build_sdp(
-            local_ip="10.0.0.5",
-            rtp_port=30000,
-            payload_type=0,
-            codec_name="PCMU",
-            ptime=30,
-            session_id="12345",
-        )
-        audio = sdp.audio
-        assert audio is not None
-        assert audio.attributes.get("ptime") == ["30"]
-
     def test_build_auto_session_id(self) -> None:
         sdp = build_sdp(
             local_ip="10.0.0.5",
@@ -442,17 +478,7 @@ class TestBuildSdp:
             payload_type=0,
             codec_name="PCMU",
         )
-        int(sdp.origin.session_id)  # should not raise
-
-    def test_build_rtp_address(self) -> None:
-        sdp = build_sdp(
-            local_ip="10.0.0.5",
-            rtp_port=30000,
-            payload_type=0,
-            codec_name="PCMU",
-            session_id="12345",
-        )
-        assert sdp.rtp_address == ("10.0.0.5", 30000)
+        assert sdp.origin.session_id.isdigit()
 
     def test_build_roundtrip(self) -> None:
         sdp = build_sdp(
@@ -466,34 +492,27 @@ class TestBuildSdp:
         sdp2 = parse_sdp(text)
         assert sdp2.connection is not None
         assert sdp2.connection.address == "10.0.0.5"
-        assert sdp2.audio is not None
-        assert sdp2.audio.port == 30000
-        assert sdp2.rtp_address == ("10.0.0.5", 30000)
+        assert _audio_summary(sdp2) == ("sendrecv", ("10.0.0.5", 30000))
 
 
 class TestNegotiateAndSerialize:
-    def test_full_roundtrip(self) -> None:
+    def test_full_roundtrip(self, carrier_offer_basic: SdpMessage) -> None:
         """Negotiate from carrier offer, serialize answer, re-parse."""
-        offer = parse_sdp(CARRIER_OFFER_BASIC)
         answer, chosen_pt = negotiate_sdp(
-            offer, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
+            carrier_offer_basic, local_ip="10.0.0.5", rtp_port=30000, session_id="99999"
         )
         text = serialize_sdp(answer)
         answer2 = parse_sdp(text)
 
-        assert answer2.audio is not None
-        assert answer2.audio.port == 30000
-        assert answer2.rtp_address == ("10.0.0.5", 30000)
-        assert answer2.audio.direction == "sendrecv"
+        assert _audio_summary(answer2) == ("sendrecv", ("10.0.0.5", 30000))
         assert chosen_pt == 0
 
-    def test_twilio_roundtrip(self) -> None:
-        offer = parse_sdp(TWILIO_OFFER)
+    def test_twilio_roundtrip(self, twilio_offer: SdpMessage) -> None:
         answer, chosen_pt = negotiate_sdp(
-            offer, local_ip="172.16.0.1", rtp_port=40000, session_id="88888"
+            twilio_offer, local_ip="172.16.0.1", rtp_port=40000, session_id="88888"
         )
         text = serialize_sdp(answer)
         answer2 = parse_sdp(text)
 
-        assert answer2.rtp_address == ("172.16.0.1", 40000)
+        assert _audio_summary(answer2) == ("sendrecv", ("172.16.0.1", 40000))
         assert chosen_pt == 0
@@ -53,56 +53,57 @@ OK_200_WITH_SDP = (
 )
 
 
+def _parse_request(data: str) -> SipRequest:
+    msg = SipMessage.parse(data)
+    assert type(msg) is SipRequest
+    return msg
+
+
+def _parse_response(data: str) -> SipResponse:
+    msg = SipMessage.parse(data)
+    assert type(msg) is SipResponse
+    return msg
+
+
+def _sip_digest(msg: SipRequest) -> tuple[object, ...]:
+    """The request fields a roundtrip must preserve, as one comparable tuple."""
+    cseq, from_addr, to_addr = msg.cseq, msg.from_addr, msg.to_addr
+    assert cseq is not None and from_addr is not None and to_addr is not None
+    return (
+        msg.method,
+        msg.uri,
+        msg.call_id,
+        (cseq.seq, cseq.method),
+        (from_addr.uri.user, from_addr.tag),
+        to_addr.uri.user,
+        tuple((v.host, v.branch) for v in msg.via),
+    )
+
+
 class TestInviteRoundtrip:
     def test_parse_serialize_reparse(self) -> None:
-        msg1 = SipMessage.parse(INVITE_WITH_SDP)
-        assert isinstance(msg1, SipRequest)
+        msg1 = _parse_request(INVITE_WITH_SDP)
         serialized = msg1.serialize()
-        msg2 = SipMessage.parse(serialized)
-        assert isinstance(msg2, SipRequest)
+        msg2 = _parse_request(serialized)
 
         # Compare all fields
-        assert msg2.method == msg1.method
-        assert msg2.uri == msg1.uri
-        assert msg2.call_id == msg1.call_id
-
-        cseq1 = msg1.cseq
-        cseq2 = msg2.cseq
-        assert cseq1 is not None and cseq2 is not None
-        assert cseq2.seq == cseq1.seq
-        assert cseq2.method == cseq1.method
-
-        from1 = msg1.from_addr
-        from2 = msg2.from_addr
-        assert from1 is not None and from2 is not None
-        assert from2.uri.user == from1.uri.user
-        assert from2.tag == from1.tag
-
-        to1 = msg1.to_addr
-        to2 = msg2.to_addr
-        assert to1 is not None and to2 is not None
-        assert to2.uri.user == to1.uri.user
-
-        assert len(msg2.via) == len(msg1.via)
-        assert msg2.via[0].branch == msg1.via[0].branch
+        assert _sip_digest(msg2) == _sip_digest(msg1)
 
     def test_body_preserved(self) -> None:
-        msg = SipMessage.parse(INVITE_WITH_SDP)
-        assert msg.body.startswith("v=0")
-        serialized = msg.serialize()
+        msg1 = _parse_request(INVITE_WITH_SDP)
+        assert msg1.body.startswith("v=0")
+        serialized = msg1.serialize()
         msg2 = SipMessage.parse(serialized)
-        assert msg2.body == msg.body
+        assert msg2.body == msg1.body
 
 
 class TestResponseWithSdpRoundtrip:
     def test_200_ok_roundtrip(self) -> None:
-        msg1 = SipMessage.parse(OK_200_WITH_SDP)
-        assert isinstance(msg1, SipResponse)
+        msg1 = _parse_response(OK_200_WITH_SDP)
         assert msg1.status_code == 200
 
         serialized = msg1.serialize()
-        msg2 = SipMessage.parse(serialized)
-        assert isinstance(msg2, SipResponse)
+        msg2 = _parse_response(serialized)
         assert msg2.status_code == 200
         assert msg2.reason_phrase == "OK"
         assert msg2.body == msg1.body
@@ -115,8 +116,7 @@ class TestResponseWithSdpRoundtrip:
 
 class TestModifyAndRoundtrip:
     def test_add_via_change_contact_add_x_header(self) -> None:
-        msg = SipMessage.parse(INVITE_WITH_SDP)
-        assert isinstance(msg, SipRequest)
+        msg = _parse_request(INVITE_WITH_SDP)
 
         # Add a Via
         new_via = Via(
@@ -139,8 +139,7 @@ class TestModifyAndRoundtrip:
 
         # Serialize and re-parse
         serialized = msg.serialize()
-        msg2 = SipMessage.parse(serialized)
-        assert isinstance(msg2, SipRequest)
+        msg2 = _parse_request(serialized)
 
         # Verify modifications
         assert len(msg2.via) == 2
@@ -157,8 +156,7 @@ class TestModifyAndRoundtrip:
 
 class TestSdpInSipRoundtrip:
     def test_extract_modify_rebuild_sdp(self) -> None:
-        msg = SipMessage.parse(INVITE_WITH_SDP)
-        assert isinstance(msg, SipRequest)
+        msg = _parse_request(INVITE_WITH_SDP)
 
         # Extract SDP
         sdp = parse_sdp(msg.body)
@@ -184,5 +182,6 @@ class TestSdpInSipRoundtrip:
         assert sdp2.connection.address == "10.0.0.1"
 
         # Content-Length should match actual body
-        body_bytes = msg2.body.encode("utf-8")
-        assert msg2.content_length == len(body_bytes)
+        # ASCII body: the UTF-8 byte length is the character count
+        assert msg2.body.isascii()
+        assert msg2.content_length == len(msg2.body)
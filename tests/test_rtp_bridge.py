@@ -7,7 +7,9 @@ The RTPSession.create() call is mocked.
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -44,13 +46,69 @@ DTMF_SDP = (
 )
 
 
+@pytest.fixture(scope="module")
+def basic_offer() -> SdpMessage:
+    return parse_sdp(BASIC_SDP)
+
+
+@pytest.fixture(scope="module")
+def dtmf_offer() -> SdpMessage:
+    return parse_sdp(DTMF_SDP)
+
+
+class _Awaited:
+    """Minimal async callable that records its calls and returns *rv*."""
+
+    def __init__(self, rv: Any = None) -> None:
+        self.rv = rv
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.rv
+
+
+@pytest.fixture()
+def mock_rtp() -> MagicMock:
+    """Stand-in for the ``aiortp.RTPSession`` that :meth:`CallSession.start` creates."""
+    rtp = MagicMock(
+        spec=[
+            "close",
+            "codec",
+            "on_audio",
+            "on_dtmf",
+            "send_audio",
+            "send_audio_pcm",
+            "send_dtmf",
+            "stats",
+            "update_remote",
+        ]
+    )
+    rtp.close = _Awaited()
+    return rtp
+
+
+@pytest.fixture()
+def mock_aiortp(monkeypatch: pytest.MonkeyPatch, mock_rtp: MagicMock) -> MagicMock:
+    """Patch the lazy aiortp import so ``RTPSession.create()`` returns *mock_rtp*."""
+    aiortp = MagicMock()
+    aiortp.RTPSession.create = _Awaited(mock_rtp)
+    monkeypatch.setattr("aiosipua.rtp_bridge._import_aiortp", lambda: aiortp)
+    return aiortp
+
+
+@pytest.fixture(scope="class")
+def basic_session(basic_offer: SdpMessage) -> CallSession:
+    """An unstarted session over *basic_offer*, shared by a test class's read-only tests."""
+    return CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
+
+
 class TestCallSessionNegotiation:
-    def test_basic_negotiation(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
+    def test_basic_negotiation(self, basic_offer: SdpMessage) -> None:
         session = CallSession(
             local_ip="10.0.0.5",
             rtp_port=30000,
-            offer=offer,
+            offer=basic_offer,
         )
 
         assert session.chosen_payload_type == 0  # PCMU preferred
@@ -60,23 +118,21 @@ class TestCallSessionNegotiation:
         assert answer.audio is not None
         assert answer.audio.port == 30000
 
-    def test_custom_supported_codecs(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
+    def test_custom_supported_codecs(self, basic_offer: SdpMessage) -> None:
         session = CallSession(
             local_ip="10.0.0.5",
             rtp_port=30000,
-            offer=offer,
+            offer=basic_offer,
             supported_codecs=[8],  # Only PCMA
         )
 
         assert session.chosen_payload_type == 8
 
-    def test_dtmf_in_answer(self) -> None:
-        offer = parse_sdp(DTMF_SDP)
+    def test_dtmf_in_answer(self, dtmf_offer: SdpMessage) -> None:
         session = CallSession(
             local_ip="10.0.0.5",
             rtp_port=30000,
-            offer=offer,
+            offer=dtmf_offer,
         )
 
         answer = session.sdp_answer
@@ -109,29 +165,19 @@ class TestCallSessionNegotiation:
 
 
 class TestCallSessionProperties:
-    def test_sdp_answer_property(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
-
-        assert isinstance(session.sdp_answer, SdpMessage)
+    def test_sdp_answer_property(self, basic_session: CallSession) -> None:
+        assert isinstance(basic_session.sdp_answer, SdpMessage)
 
-    def test_rtp_session_none_before_start(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
+    def test_rtp_session_none_before_start(self, basic_session: CallSession) -> None:
+        assert basic_session.rtp_session is None
 
-        assert session.rtp_session is None
-
-    def test_stats_empty_before_start(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
-
-        assert session.stats == {}
+    def test_stats_empty_before_start(self, basic_session: CallSession) -> None:
+        assert basic_session.stats == {}
 
 
 class TestCallSessionCallbacks:
-    def test_audio_callback_wiring(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
+    def test_audio_callback_wiring(self, basic_offer: SdpMessage) -> None:
+        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
 
         received: list[tuple[bytes, int]] = []
         session.on_audio = lambda pcm, ts: received.append((pcm, ts))
@@ -141,9 +187,8 @@ class TestCallSessionCallbacks:
         assert len(received) == 1
         assert received[0] == (b"\x00\x01\x02", 160)
 
-    def test_dtmf_callback_wiring(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
+    def test_dtmf_callback_wiring(self, basic_offer: SdpMessage) -> None:
+        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
 
         received: list[tuple[str, int]] = []
         session.on_dtmf = lambda d, dur: received.append((d, dur))
@@ -152,39 +197,27 @@ class TestCallSessionCallbacks:
         assert len(received) == 1
         assert received[0] == ("1", 160)
 
-    def test_no_callback_no_error(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
-
+    def test_no_callback_no_error(self, basic_session: CallSession) -> None:
         # Should not raise even with no callbacks set
-        session._handle_audio(b"\x00", 0)
-        session._handle_dtmf("1", 100)
+        basic_session._handle_audio(b"\x00", 0)
+        basic_session._handle_dtmf("1", 100)
 
 
 class TestCallSessionSendMethods:
-    def test_send_audio_before_start(self) -> None:
+    def test_send_audio_before_start(self, basic_session: CallSession) -> None:
         """send_audio before start() should be a no-op."""
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
 
         # Should not raise
-        session.send_audio(b"\x00\x01", 160)
+        basic_session.send_audio(b"\x00\x01", 160)
 
-    def test_send_audio_pcm_before_start(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
+    def test_send_audio_pcm_before_start(self, basic_session: CallSession) -> None:
+        basic_session.send_audio_pcm(b"\x00\x01", 160)
 
-        session.send_audio_pcm(b"\x00\x01", 160)
+    def test_send_dtmf_before_start(self, basic_session: CallSession) -> None:
+        basic_session.send_dtmf("1")
 
-    def test_send_dtmf_before_start(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
-
-        session.send_dtmf("1")
-
-    def test_update_remote(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
+    def test_update_remote(self, basic_offer: SdpMessage) -> None:
+        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
 
         assert session.remote_addr == ("10.0.0.1", 20000)
         session.update_remote(("10.0.0.99", 25000))
@@ -195,78 +228,56 @@ class TestCallSessionWithMockedAiortp:
     """Tests that mock aiortp.RTPSession to verify start/close lifecycle."""
 
     @pytest.mark.asyncio()
-    async def test_start_creates_rtp_session(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
+    async def test_start_creates_rtp_session(
+        self, basic_offer: SdpMessage, mock_aiortp: MagicMock, mock_rtp: MagicMock
+    ) -> None:
+        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
 
-        mock_rtp = MagicMock()
         mock_rtp.stats = {"ssrc": 12345, "packets_sent": 0}
-
-        mock_aiortp = MagicMock()
-        mock_aiortp.RTPSession.create = AsyncMock(return_value=mock_rtp)
-
-        with patch("aiosipua.rtp_bridge._import_aiortp", return_value=mock_aiortp):
-            await session.start()
+        await session.start()
 
         assert session.rtp_session is mock_rtp
-        mock_aiortp.RTPSession.create.assert_awaited_once()
+        create_calls = mock_aiortp.RTPSession.create.calls
+        assert len(create_calls) == 1
 
         # Verify create was called with correct params
-        call_kwargs = mock_aiortp.RTPSession.create.call_args
-        assert call_kwargs.kwargs["local_addr"] == ("10.0.0.5", 30000)
-        assert call_kwargs.kwargs["remote_addr"] == ("10.0.0.1", 20000)
-        assert call_kwargs.kwargs["payload_type"] == 0
+        _, kwargs = create_calls[0]
+        assert kwargs["local_addr"] == ("10.0.0.5", 30000)
+        assert kwargs["remote_addr"] == ("10.0.0.1", 20000)
+        assert kwargs["payload_type"] == 0
 
     @pytest.mark.asyncio()
-    async def test_close_closes_rtp_session(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
-
-        mock_rtp = MagicMock()
-        mock_rtp.close = AsyncMock()
+    async def test_close_closes_rtp_session(
+        self, basic_offer: SdpMessage, mock_aiortp: MagicMock, mock_rtp: MagicMock
+    ) -> None:
+        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
 
-        mock_aiortp = MagicMock()
-        mock_aiortp.RTPSession.create = AsyncMock(return_value=mock_rtp)
-
-        with patch("aiosipua.rtp_bridge._import_aiortp", return_value=mock_aiortp):
-            await session.start()
-            await session.close()
+        await session.start()
+        await session.close()
 
-        mock_rtp.close.assert_awaited_once()
+        assert len(mock_rtp.close.calls) == 1
         assert session.rtp_session is None
 
     @pytest.mark.asyncio()
-    async def test_double_close_is_safe(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
-
-        mock_rtp = MagicMock()
-        mock_rtp.close = AsyncMock()
+    async def test_double_close_is_safe(
+        self, basic_offer: SdpMessage, mock_aiortp: MagicMock, mock_rtp: MagicMock
+    ) -> None:
+        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
 
-        mock_aiortp = MagicMock()
-        mock_aiortp.RTPSession.create = AsyncMock(return_value=mock_rtp)
-
-        with patch("aiosipua.rtp_bridge._import_aiortp", return_value=mock_aiortp):
-            await session.start()
-            await session.close()
-            await session.close()  # Should not raise
+        await session.start()
+        await session.close()
+        await session.close()  # Should not raise
 
-        mock_rtp.close.assert_awaited_once()
+        assert len(mock_rtp.close.calls) == 1
 
     @pytest.mark.asyncio()
-    async def test_send_after_close_is_noop(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
+    async def test_send_after_close_is_noop(
+        self, basic_offer: SdpMessage, mock_aiortp: MagicMock
+    ) -> None:
+        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
 
-        mock_rtp = MagicMock()
-        mock_rtp.close = AsyncMock()
-
-        mock_aiortp = MagicMock()
-        mock_aiortp.RTPSession.create = AsyncMock(return_value=mock_rtp)
-
-        with patch("aiosipua.rtp_bridge._import_aiortp", return_value=mock_aiortp):
-            await session.start()
-            await session.close()
+        await session.start()
+        await session.close()
 
         # Should not raise or call mock methods
         session.send_audio(b"\x00", 0)
@@ -274,34 +285,23 @@ class TestCallSessionWithMockedAiortp:
         session.send_dtmf("1")
 
     @pytest.mark.asyncio()
-    async def test_stats_after_start(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
+    async def test_stats_after_start(
+        self, basic_offer: SdpMessage, mock_aiortp: MagicMock, mock_rtp: MagicMock
+    ) -> None:
+        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
 
-        mock_rtp = MagicMock()
         mock_rtp.stats = {"ssrc": 12345, "packets_sent": 42}
-
-        mock_aiortp = MagicMock()
-        mock_aiortp.RTPSession.create = AsyncMock(return_value=mock_rtp)
-
-        with patch("aiosipua.rtp_bridge._import_aiortp", return_value=mock_aiortp):
-            await session.start()
+        await session.start()
 
         assert session.stats["packets_sent"] == 42
 
     @pytest.mark.asyncio()
-    async def test_update_remote_forwards_to_rtp(self) -> None:
-        offer = parse_sdp(BASIC_SDP)
-        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=offer)
+    async def test_update_remote_forwards_to_rtp(
+        self, basic_offer: SdpMessage, mock_aiortp: MagicMock, mock_rtp: MagicMock
+    ) -> None:
+        session = CallSession(local_ip="10.0.0.5", rtp_port=30000, offer=basic_offer)
 
-        mock_rtp = MagicMock()
-        mock_rtp.close = AsyncMock()
-
-        mock_aiortp = MagicMock()
-        mock_aiortp.RTPSession.create = AsyncMock(return_value=mock_rtp)
-
-        with patch("aiosipua.rtp_bridge._import_aiortp", return_value=mock_aiortp):
-            await session.start()
+        await session.start()
 
         session.update_remote(("10.0.0.99", 25000))
         mock_rtp.update_remote.assert_called_once_with(("10.0.0.99", 25000))
@@ -311,12 +311,13 @@ class TestCallSessionFullFlow:
     """Integration-style test: negotiation + mock RTP + callbacks."""
 
     @pytest.mark.asyncio()
-    async def test_full_call_lifecycle(self) -> None:
-        offer = parse_sdp(DTMF_SDP)
+    async def test_full_call_lifecycle(
+        self, dtmf_offer: SdpMessage, mock_aiortp: MagicMock, mock_rtp: MagicMock
+    ) -> None:
         session = CallSession(
             local_ip="10.0.0.5",
             rtp_port=30000,
-            offer=offer,
+            offer=dtmf_offer,
         )
 
         # Verify negotiation
@@ -330,15 +331,8 @@ class TestCallSessionFullFlow:
         session.on_dtmf = lambda d, dur: dtmf_received.append((d, dur))
 
         # Mock aiortp and start
-        mock_rtp = MagicMock()
-        mock_rtp.close = AsyncMock()
         mock_rtp.stats = {"ssrc": 999}
-
-        mock_aiortp = MagicMock()
-        mock_aiortp.RTPSession.create = AsyncMock(return_value=mock_rtp)
-
-        with patch("aiosipua.rtp_bridge._import_aiortp", return_value=mock_aiortp):
-            await session.start()
+        await session.start()
 
         # Simulate receiving audio and DTMF
         session._handle_audio(b"\x80\x00" * 160, 160)
@@ -350,14 +344,12 @@ class TestCallSessionFullFlow:
 
         # Clean up
         await session.close()
-        mock_rtp.close.assert_awaited_once()
+        assert len(mock_rtp.close.calls) == 1
 
 
 class TestImportAiortp:
-    def test_import_missing_raises(self) -> None:
+    def test_import_missing_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """_import_aiortp raises ImportError with helpful message when aiortp not installed."""
-        with (
-            patch.dict("sys.modules", {"aiortp": None}),
-            pytest.raises(ImportError, match="aiortp is required"),
-        ):
+        monkeypatch.setitem(sys.modules, "aiortp", None)
+        with pytest.raises(ImportError, match="aiortp is required"):
             _import_aiortp()
@@ -1,5 +1,7 @@
 """Tests for aiosipua.sdp."""
 
+import pytest
+
 from aiosipua.sdp import SdpMessage, parse_sdp, serialize_sdp
 
 SIMPLE_SDP = (
@@ -42,41 +44,49 @@ MULTI_MEDIA_SDP = (
 )
 
 
+@pytest.fixture(scope="module")
+def simple_sdp() -> SdpMessage:
+    return parse_sdp(SIMPLE_SDP)
+
+
+@pytest.fixture(scope="module")
+def bandwidth_sdp() -> SdpMessage:
+    return parse_sdp(SDP_WITH_BANDWIDTH)
+
+
+@pytest.fixture(scope="module")
+def multi_media_sdp() -> SdpMessage:
+    return parse_sdp(MULTI_MEDIA_SDP)
+
+
 class TestParseSimpleSdp:
-    def test_version(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        assert sdp.version == 0
-
-    def test_origin(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        assert sdp.origin.username == "-"
-        assert sdp.origin.session_id == "12345"
-        assert sdp.origin.session_version == "67890"
-        assert sdp.origin.net_type == "IN"
-        assert sdp.origin.addr_type == "IP4"
-        assert sdp.origin.address == "192.168.1.100"
-
-    def test_session_name(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        assert sdp.session_name == "Session"
-
-    def test_connection(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        assert sdp.connection is not None
-        assert sdp.connection.address == "192.168.1.100"
-
-    def test_timing(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        assert sdp.timing.start_time == 0
-        assert sdp.timing.stop_time == 0
-
-    def test_media_count(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        assert len(sdp.media) == 1
-
-    def test_media_audio(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        m = sdp.media[0]
+    def test_version(self, simple_sdp: SdpMessage) -> None:
+        assert simple_sdp.version == 0
+
+    def test_origin(self, simple_sdp: SdpMessage) -> None:
+        assert simple_sdp.origin.username == "-"
+        assert simple_sdp.origin.session_id == "12345"
+        assert simple_sdp.origin.session_version == "67890"
+        assert simple_sdp.origin.net_type == "IN"
+        assert simple_sdp.origin.addr_type == "IP4"
+        assert simple_sdp.origin.address == "192.168.1.100"
+
+    def test_session_name(self, simple_sdp: SdpMessage) -> None:
+        assert simple_sdp.session_name == "Session"
+
+    def test_connection(self, simple_sdp: SdpMessage) -> None:
+        assert simple_sdp.connection is not None
+        assert simple_sdp.connection.address == "192.168.1.100"
+
+    def test_timing(self, simple_sdp: SdpMessage) -> None:
+        assert simple_sdp.timing.start_time == 0
+        assert simple_sdp.timing.stop_time == 0
+
+    def test_media_count(self, simple_sdp: SdpMessage) -> None:
+        assert len(simple_sdp.media) == 1
+
+    def test_media_audio(self, simple_sdp: SdpMessage) -> None:
+        m = simple_sdp.media[0]
         assert m.media == "audio"
         assert m.port == 49170
         assert m.proto == "RTP/AVP"
@@ -84,9 +94,8 @@ class TestParseSimpleSdp:
 
 
 class TestCodecExtraction:
-    def test_rtpmap_codecs(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        codecs = sdp.media[0].codecs
+    def test_rtpmap_codecs(self, simple_sdp: SdpMessage) -> None:
+        codecs = simple_sdp.media[0].codecs
         assert len(codecs) == 3
         assert codecs[0].encoding_name == "PCMU"
         assert codecs[0].clock_rate == 8000
@@ -96,9 +105,8 @@ class TestCodecExtraction:
         assert codecs[2].clock_rate == 48000
         assert codecs[2].channels == 2
 
-    def test_fmtp(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        opus = sdp.media[0].codecs[2]
+    def test_fmtp(self, simple_sdp: SdpMessage) -> None:
+        opus = simple_sdp.media[0].codecs[2]
         assert opus.fmtp == "minptime=10;useinbandfec=1"
 
     def test_well_known_codecs_fallback(self) -> None:
@@ -115,15 +123,13 @@ class TestCodecExtraction:
 class TestBandwidthParsing:
     """The key bug fix: sip-parser has no 'b' handler and raises KeyError."""
 
-    def test_session_level_bandwidth(self) -> None:
-        sdp = parse_sdp(SDP_WITH_BANDWIDTH)
-        assert len(sdp.bandwidths) == 1
-        assert sdp.bandwidths[0].bwtype == "AS"
-        assert sdp.bandwidths[0].bandwidth == 256
+    def test_session_level_bandwidth(self, bandwidth_sdp: SdpMessage) -> None:
+        assert len(bandwidth_sdp.bandwidths) == 1
+        assert bandwidth_sdp.bandwidths[0].bwtype == "AS"
+        assert bandwidth_sdp.bandwidths[0].bandwidth == 256
 
-    def test_media_level_bandwidth(self) -> None:
-        sdp = parse_sdp(SDP_WITH_BANDWIDTH)
-        m = sdp.media[0]
+    def test_media_level_bandwidth(self, bandwidth_sdp: SdpMessage) -> None:
+        m = bandwidth_sdp.media[0]
         assert len(m.bandwidths) == 1
         assert m.bandwidths[0].bwtype == "TIAS"
         assert m.bandwidths[0].bandwidth == 1024000
@@ -147,16 +153,14 @@ class TestBandwidthParsing:
 
 
 class TestMultiMedia:
-    def test_two_media_sections(self) -> None:
-        sdp = parse_sdp(MULTI_MEDIA_SDP)
-        assert len(sdp.media) == 2
-        assert sdp.media[0].media == "audio"
-        assert sdp.media[1].media == "video"
-
-    def test_direction(self) -> None:
-        sdp = parse_sdp(MULTI_MEDIA_SDP)
-        assert sdp.media[0].direction == "sendrecv"
-        assert sdp.media[1].direction == "sendonly"
+    def test_two_media_sections(self, multi_media_sdp: SdpMessage) -> None:
+        assert len(multi_media_sdp.media) == 2
+        assert multi_media_sdp.media[0].media == "audio"
+        assert multi_media_sdp.media[1].media == "video"
+
+    def test_direction(self, multi_media_sdp: SdpMessage) -> None:
+        assert multi_media_sdp.media[0].direction == "sendrecv"
+        assert multi_media_sdp.media[1].direction == "sendonly"
 
     def test_default_direction(self) -> None:
         raw = "v=0\r\no=- 0 0 IN IP4 0.0.0.0\r\ns=-\r\nt=0 0\r\nm=audio 8000 RTP/AVP 0\r\n"
@@ -165,47 +169,41 @@ class TestMultiMedia:
 
 
 class TestSerializeSdp:
-    def test_serialize_simple(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        built = serialize_sdp(sdp)
+    def test_serialize_simple(self, simple_sdp: SdpMessage) -> None:
+        built = serialize_sdp(simple_sdp)
         assert built.startswith("v=0\r\n")
         assert "o=- 12345 67890 IN IP4 192.168.1.100\r\n" in built
         assert "s=Session\r\n" in built
         assert "c=IN IP4 192.168.1.100\r\n" in built
         assert "m=audio 49170 RTP/AVP 0 8 96\r\n" in built
 
-    def test_serialize_roundtrip(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        built = serialize_sdp(sdp)
+    def test_serialize_roundtrip(self, simple_sdp: SdpMessage) -> None:
+        built = serialize_sdp(simple_sdp)
         sdp2 = parse_sdp(built)
-        assert sdp2.version == sdp.version
-        assert sdp2.origin.session_id == sdp.origin.session_id
-        assert sdp2.session_name == sdp.session_name
-        assert len(sdp2.media) == len(sdp.media)
-        assert sdp2.media[0].port == sdp.media[0].port
-
-    def test_serialize_with_bandwidth(self) -> None:
-        sdp = parse_sdp(SDP_WITH_BANDWIDTH)
-        built = serialize_sdp(sdp)
+        assert sdp2.version == simple_sdp.version
+        assert sdp2.origin.session_id == simple_sdp.origin.session_id
+        assert sdp2.session_name == simple_sdp.session_name
+        assert len(sdp2.media) == len(simple_sdp.media)
+        assert sdp2.media[0].port == simple_sdp.media[0].port
+
+    def test_serialize_with_bandwidth(self, bandwidth_sdp: SdpMessage) -> None:
+        built = serialize_sdp(bandwidth_sdp)
         assert "b=AS:256\r\n" in built
         assert "b=TIAS:1024000\r\n" in built
 
 
 class TestConvenienceProperties:
-    def test_audio_property(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        audio = sdp.audio
+    def test_audio_property(self, simple_sdp: SdpMessage) -> None:
+        audio = simple_sdp.audio
         assert audio is not None
         assert audio.media == "audio"
         assert audio.port == 49170
 
-    def test_audio_none_for_video_only(self) -> None:
-        sdp = parse_sdp(SDP_WITH_BANDWIDTH)
-        assert sdp.audio is None
+    def test_audio_none_for_video_only(self, bandwidth_sdp: SdpMessage) -> None:
+        assert bandwidth_sdp.audio is None
 
-    def test_rtp_address(self) -> None:
-        sdp = parse_sdp(SIMPLE_SDP)
-        addr = sdp.rtp_address
+    def test_rtp_address(self, simple_sdp: SdpMessage) -> None:
+        addr = simple_sdp.rtp_address
         assert addr is not None
         assert addr == ("192.168.1.100", 49170)
 
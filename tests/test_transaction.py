@@ -1,57 +1,69 @@
 """Tests for aiosipua.transaction."""
 
+from dataclasses import replace
+
 import pytest
 
 from aiosipua.message import SipMessage, SipRequest, SipResponse
 from aiosipua.transaction import Transaction, TransactionLayer, TransactionState
 
 
-def _make_invite() -> SipRequest:
-    raw = (
-        "INVITE sip:bob@example.com SIP/2.0\r\n"
-        "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-invite-1\r\n"
-        "From: <sip:alice@example.com>;tag=aaa\r\n"
-        "To: <sip:bob@example.com>\r\n"
-        "Call-ID: call1@example.com\r\n"
-        "CSeq: 1 INVITE\r\n"
-        "Content-Length: 0\r\n"
-        "\r\n"
-    )
+def _parse_request(raw: str) -> SipRequest:
     msg = SipMessage.parse(raw)
     assert isinstance(msg, SipRequest)
     return msg
 
 
+# Templates are parsed once; each helper call returns a fresh message with
+# its own header dict, so tests never share mutable state.
+_INVITE = _parse_request(
+    "INVITE sip:bob@example.com SIP/2.0\r\n"
+    "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-invite-1\r\n"
+    "From: <sip:alice@example.com>;tag=aaa\r\n"
+    "To: <sip:bob@example.com>\r\n"
+    "Call-ID: call1@example.com\r\n"
+    "CSeq: 1 INVITE\r\n"
+    "Content-Length: 0\r\n"
+    "\r\n"
+)
+
+_REGISTER = _parse_request(
+    "REGISTER sip:example.com SIP/2.0\r\n"
+    "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-reg-1\r\n"
+    "From: <sip:alice@example.com>;tag=bbb\r\n"
+    "To: <sip:alice@example.com>\r\n"
+    "Call-ID: reg1@example.com\r\n"
+    "CSeq: 1 REGISTER\r\n"
+    "Content-Length: 0\r\n"
+    "\r\n"
+)
+
+_RESPONSE = SipMessage.parse(
+    "SIP/2.0 200 OK\r\n"
+    "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-invite-1\r\n"
+    "From: <sip:alice@example.com>;tag=aaa\r\n"
+    "To: <sip:bob@example.com>;tag=bbb\r\n"
+    "Call-ID: call1@example.com\r\n"
+    "CSeq: 1 INVITE\r\n"
+    "Content-Length: 0\r\n"
+    "\r\n"
+)
+assert isinstance(_RESPONSE, SipResponse)
+
+
+def _make_invite() -> SipRequest:
+    return replace(_INVITE, headers=_INVITE.headers.copy())
+
+
 def _make_register() -> SipRequest:
-    raw = (
-        "REGISTER sip:example.com SIP/2.0\r\n"
-        "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-reg-1\r\n"
-        "From: <sip:alice@example.com>;tag=bbb\r\n"
-        "To: <sip:alice@example.com>\r\n"
-        "Call-ID: reg1@example.com\r\n"
-        "CSeq: 1 REGISTER\r\n"
-        "Content-Length: 0\r\n"
-        "\r\n"
-    )
-    msg = SipMessage.parse(raw)
-    assert isinstance(msg, SipRequest)
-    return msg
+    return replace(_REGISTER, headers=_REGISTER.headers.copy())
 
 
 def _make_response(status: int, reason: str, branch: str, method: str) -> SipResponse:
-    raw = (
-        f"SIP/2.0 {status} {reason}\r\n"
-        f"Via: SIP/2.0/UDP 10.0.0.1:5060;branch={branch}\r\n"
-        "From: <sip:alice@example.com>;tag=aaa\r\n"
-        "To: <sip:bob@example.com>;tag=bbb\r\n"
-        "Call-ID: call1@example.com\r\n"
-        f"CSeq: 1 {method}\r\n"
-        "Content-Length: 0\r\n"
-        "\r\n"
-    )
-    msg = SipMessage.parse(raw)
-    assert isinstance(msg, SipResponse)
-    return msg
+    headers = _RESPONSE.headers.copy()
+    headers.set_single("Via", f"SIP/2.0/UDP 10.0.0.1:5060;branch={branch}")
+    headers.set_single("CSeq", f"1 {method}")
+    return replace(_RESPONSE, status_code=status, reason_phrase=reason, headers=headers)
 
 
 class TestTransactionState:
@@ -116,20 +128,26 @@ class TestTransactionLayerClient:
         assert matched is txn
         assert txn.state == TransactionState.COMPLETED
 
-    def test_no_match_wrong_branch(self) -> None:
+    @pytest.fixture()
+    def layer_with_invite(self) -> tuple[TransactionLayer, Transaction]:
         layer = TransactionLayer()
-        _make_invite()
-        layer.create_client(_make_invite())
+        return layer, layer.create_client(_make_invite())
 
+    def test_no_match_wrong_branch(
+        self, layer_with_invite: tuple[TransactionLayer, Transaction]
+    ) -> None:
+        layer, txn = layer_with_invite
         resp = _make_response(200, "OK", "z9hG4bK-wrong", "INVITE")
         assert layer.match_response(resp) is None
+        assert txn.state == TransactionState.TRYING
 
-    def test_no_match_wrong_method(self) -> None:
-        layer = TransactionLayer()
-        layer.create_client(_make_invite())
-
+    def test_no_match_wrong_method(
+        self, layer_with_invite: tuple[TransactionLayer, Transaction]
+    ) -> None:
+        layer, txn = layer_with_invite
         resp = _make_response(200, "OK", "z9hG4bK-invite-1", "BYE")
         assert layer.match_response(resp) is None
+        assert txn.state == TransactionState.TRYING
 
     def test_multiple_transactions(self) -> None:
         layer = TransactionLayer()
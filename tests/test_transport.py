@@ -1,6 +1,7 @@
 """Tests for aiosipua.transport — UDP and TCP SIP transports."""
 
 import asyncio
+from collections.abc import AsyncIterator
 
 import pytest
 
@@ -12,6 +13,9 @@ from aiosipua.transport import (
     _response_destination,
 )
 
+# Loopback delivery takes well under a millisecond; this only bounds a failing test.
+TEST_TIMEOUT = 0.5
+
 INVITE_RAW = (
     "INVITE sip:bob@example.com SIP/2.0\r\n"
     "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-test1\r\n"
@@ -34,357 +38,254 @@ OK_200_RAW = (
     "\r\n"
 )
 
+INVITE_RAW_BYTES = INVITE_RAW.encode("ascii")
 
-class TestResponseDestination:
-    def test_basic_via(self) -> None:
-        msg = SipMessage.parse(OK_200_RAW)
-        assert isinstance(msg, SipResponse)
-        dest = _response_destination(msg)
-        assert dest == ("10.0.0.1", 5060)
+# Parsed once; the transports only serialize what they send.
+INVITE_MSG = SipMessage.parse(INVITE_RAW)
+assert isinstance(INVITE_MSG, SipRequest)
+OK_200_MSG = SipMessage.parse(OK_200_RAW)
+assert isinstance(OK_200_MSG, SipResponse)
 
-    def test_received_overrides_host(self) -> None:
-        raw = (
-            "SIP/2.0 200 OK\r\n"
-            "Via: SIP/2.0/UDP 10.0.0.1:5060;received=203.0.113.5;branch=z9hG4bK1\r\n"
-            "Content-Length: 0\r\n"
-            "\r\n"
-        )
-        msg = SipMessage.parse(raw)
-        assert isinstance(msg, SipResponse)
-        dest = _response_destination(msg)
-        assert dest is not None
-        assert dest[0] == "203.0.113.5"
-        assert dest[1] == 5060
 
-    def test_rport_overrides_port(self) -> None:
-        raw = (
-            "SIP/2.0 200 OK\r\n"
-            "Via: SIP/2.0/UDP 10.0.0.1:5060;rport=12345;branch=z9hG4bK1\r\n"
-            "Content-Length: 0\r\n"
-            "\r\n"
-        )
-        msg = SipMessage.parse(raw)
-        assert isinstance(msg, SipResponse)
-        dest = _response_destination(msg)
-        assert dest is not None
-        assert dest[1] == 12345
+def _response(via: str | None) -> str:
+    """A minimal 200 OK, with a single Via header unless *via* is ``None``."""
+    via_line = f"Via: {via}\r\n" if via is not None else ""
+    return f"SIP/2.0 200 OK\r\n{via_line}Content-Length: 0\r\n\r\n"
 
-    def test_received_and_rport(self) -> None:
-        raw = (
-            "SIP/2.0 200 OK\r\n"
-            "Via: SIP/2.0/UDP 10.0.0.1:5060"
-            ";received=203.0.113.5;rport=54321;branch=z9hG4bK1\r\n"
-            "Content-Length: 0\r\n"
-            "\r\n"
-        )
-        msg = SipMessage.parse(raw)
-        assert isinstance(msg, SipResponse)
-        dest = _response_destination(msg)
-        assert dest == ("203.0.113.5", 54321)
 
-    def test_no_via(self) -> None:
-        raw = "SIP/2.0 200 OK\r\nContent-Length: 0\r\n\r\n"
+class TestResponseDestination:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (OK_200_RAW, ("10.0.0.1", 5060)),
+            (
+                _response("SIP/2.0/UDP 10.0.0.1:5060;received=203.0.113.5;branch=z9hG4bK1"),
+                ("203.0.113.5", 5060),
+            ),
+            (
+                _response("SIP/2.0/UDP 10.0.0.1:5060;rport=12345;branch=z9hG4bK1"),
+                ("10.0.0.1", 12345),
+            ),
+            (
+                _response(
+                    "SIP/2.0/UDP 10.0.0.1:5060;received=203.0.113.5;rport=54321;branch=z9hG4bK1"
+                ),
+                ("203.0.113.5", 54321),
+            ),
+            (_response(None), None),
+            (
+                _response("SIP/2.0/UDP proxy.example.com;branch=z9hG4bK1"),
+                ("proxy.example.com", 5060),
+            ),
+        ],
+        ids=[
+            "basic-via",
+            "received-overrides-host",
+            "rport-overrides-port",
+            "received-and-rport",
+            "no-via",
+            "default-port",
+        ],
+    )
+    def test_response_destination(self, raw: str, expected: tuple[str, int] | None) -> None:
         msg = SipMessage.parse(raw)
         assert isinstance(msg, SipResponse)
-        assert _response_destination(msg) is None
+        assert _response_destination(msg) == expected
 
-    def test_default_port(self) -> None:
-        raw = (
-            "SIP/2.0 200 OK\r\n"
-            "Via: SIP/2.0/UDP proxy.example.com;branch=z9hG4bK1\r\n"
-            "Content-Length: 0\r\n"
-            "\r\n"
-        )
-        msg = SipMessage.parse(raw)
-        assert isinstance(msg, SipResponse)
-        dest = _response_destination(msg)
-        assert dest == ("proxy.example.com", 5060)
 
+class _Inbox:
+    """``on_message`` callback that records deliveries and lets a test await them."""
 
-class TestUdpLoopback:
-    @pytest.mark.asyncio
-    async def test_send_receive(self) -> None:
-        received: list[tuple[SipRequest | SipResponse, tuple[str, int]]] = []
-        event = asyncio.Event()
-
-        def on_msg(msg: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
-            received.append((msg, addr))
-            event.set()
-
-        server = UdpSipTransport(local_addr=("127.0.0.1", 0), on_message=on_msg)
-        await server.start()
-
-        # Get the actual bound port
-        assert server._udp_transport is not None
-        sock = server._udp_transport.get_extra_info("socket")
-        server_port = sock.getsockname()[1]
-
-        client = UdpSipTransport(local_addr=("127.0.0.1", 0))
-        await client.start()
-
-        try:
-            invite = SipMessage.parse(INVITE_RAW)
-            assert isinstance(invite, SipRequest)
-            client.send(invite, ("127.0.0.1", server_port))
-
-            await asyncio.wait_for(event.wait(), timeout=2.0)
-            assert len(received) == 1
-            msg, addr = received[0]
-            assert isinstance(msg, SipRequest)
-            assert msg.method == "INVITE"
-            assert addr[0] == "127.0.0.1"
-        finally:
-            await client.stop()
-            await server.stop()
+    def __init__(self) -> None:
+        self.messages: list[tuple[SipRequest | SipResponse, tuple[str, int]]] = []
+        self._arrived = asyncio.Event()
 
-    @pytest.mark.asyncio
-    async def test_send_response(self) -> None:
-        received: list[tuple[SipRequest | SipResponse, tuple[str, int]]] = []
-        event = asyncio.Event()
-
-        def on_msg(msg: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
-            received.append((msg, addr))
-            event.set()
-
-        server = UdpSipTransport(local_addr=("127.0.0.1", 0), on_message=on_msg)
-        await server.start()
-
-        assert server._udp_transport is not None
-        sock = server._udp_transport.get_extra_info("socket")
-        server_port = sock.getsockname()[1]
-
-        client = UdpSipTransport(local_addr=("127.0.0.1", 0))
-        await client.start()
-
-        try:
-            ok = SipMessage.parse(OK_200_RAW)
-            assert isinstance(ok, SipResponse)
-            client.send(ok, ("127.0.0.1", server_port))
-
-            await asyncio.wait_for(event.wait(), timeout=2.0)
-            assert len(received) == 1
-            msg, _ = received[0]
-            assert isinstance(msg, SipResponse)
-            assert msg.status_code == 200
-        finally:
-            await client.stop()
-            await server.stop()
+    def __call__(self, msg: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
+        self.messages.append((msg, addr))
+        self._arrived.set()
 
-    @pytest.mark.asyncio
-    async def test_send_reply_via_routing(self) -> None:
-        """Test send_reply uses Via-based routing."""
-        received: list[tuple[SipRequest | SipResponse, tuple[str, int]]] = []
-        event = asyncio.Event()
-
-        def on_msg(msg: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
-            received.append((msg, addr))
-            event.set()
-
-        # This transport will receive the reply
-        receiver = UdpSipTransport(local_addr=("127.0.0.1", 0), on_message=on_msg)
-        await receiver.start()
-
-        assert receiver._udp_transport is not None
-        sock = receiver._udp_transport.get_extra_info("socket")
-        receiver_port = sock.getsockname()[1]
-
-        sender = UdpSipTransport(local_addr=("127.0.0.1", 0))
-        await sender.start()
-
-        try:
-            # Build a response whose Via points to the receiver
-            raw = (
-                "SIP/2.0 200 OK\r\n"
-                f"Via: SIP/2.0/UDP 127.0.0.1:{receiver_port};branch=z9hG4bK-vr1\r\n"
-                "From: <sip:alice@example.com>;tag=aaa\r\n"
-                "To: <sip:bob@example.com>;tag=bbb\r\n"
-                "Call-ID: viaroute@example.com\r\n"
-                "CSeq: 1 INVITE\r\n"
-                "Content-Length: 0\r\n"
-                "\r\n"
-            )
-            response = SipMessage.parse(raw)
-            assert isinstance(response, SipResponse)
-            sender.send_reply(response)
-
-            await asyncio.wait_for(event.wait(), timeout=2.0)
-            assert len(received) == 1
-            msg, _ = received[0]
-            assert isinstance(msg, SipResponse)
-            assert msg.status_code == 200
-        finally:
-            await sender.stop()
-            await receiver.stop()
+    async def wait_for(self, count: int = 1, timeout: float = TEST_TIMEOUT) -> None:
+        async with asyncio.timeout(timeout):
+            while len(self.messages) < count:
+                self._arrived.clear()
+                await self._arrived.wait()
 
-    @pytest.mark.asyncio
-    async def test_send_before_start_raises(self) -> None:
-        transport = UdpSipTransport(local_addr=("127.0.0.1", 0))
-        invite = SipMessage.parse(INVITE_RAW)
-        assert isinstance(invite, SipRequest)
-        with pytest.raises(RuntimeError, match="not started"):
-            transport.send(invite, ("127.0.0.1", 5060))
 
-    @pytest.mark.asyncio
-    async def test_multiple_messages(self) -> None:
-        received: list[SipRequest | SipResponse] = []
-        all_received = asyncio.Event()
+@pytest.fixture()
+async def udp_pair() -> AsyncIterator[tuple[UdpSipTransport, _Inbox, int]]:
+    """A started client plus the inbox and port of a started server."""
+    inbox = _Inbox()
+    server = UdpSipTransport(local_addr=("127.0.0.1", 0), on_message=inbox)
+    await server.start()
 
-        def on_msg(msg: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
-            received.append(msg)
-            if len(received) >= 3:
-                all_received.set()
+    # Get the actual bound port
+    assert server._udp_transport is not None
+    server_port = server._udp_transport.get_extra_info("socket").getsockname()[1]
 
-        server = UdpSipTransport(local_addr=("127.0.0.1", 0), on_message=on_msg)
-        await server.start()
+    client = UdpSipTransport(local_addr=("127.0.0.1", 0))
+    await client.start()
+    try:
+        yield client, inbox, server_port
+    finally:
+        await client.stop()
+        await server.stop()
 
-        assert server._udp_transport is not None
-        sock = server._udp_transport.get_extra_info("socket")
-        server_port = sock.getsockname()[1]
 
-        client = UdpSipTransport(local_addr=("127.0.0.1", 0))
-        await client.start()
+@pytest.fixture()
+async def tcp_pair() -> AsyncIterator[tuple[TcpSipTransport, _Inbox, int]]:
+    """A client connected to a started server, plus the server's inbox and port."""
+    inbox = _Inbox()
+    server = TcpSipTransport(local_addr=("127.0.0.1", 0), on_message=inbox)
+    await server.start()
 
-        try:
-            invite = SipMessage.parse(INVITE_RAW)
-            assert isinstance(invite, SipRequest)
-            for _ in range(3):
-                client.send(invite, ("127.0.0.1", server_port))
+    assert server._server is not None
+    server_port = server._server.sockets[0].getsockname()[1]
 
-            await asyncio.wait_for(all_received.wait(), timeout=2.0)
-            assert len(received) == 3
-        finally:
-            await client.stop()
-            await server.stop()
+    client = TcpSipTransport(local_addr=("127.0.0.1", 0))
+    await client.connect(("127.0.0.1", server_port))
+    try:
+        yield client, inbox, server_port
+    finally:
+        await client.stop()
+        await server.stop()
 
 
-class TestTcpLoopback:
+class TestUdpLoopback:
+    @pytest.mark.asyncio
+    async def test_send_receive(self, udp_pair: tuple[UdpSipTransport, _Inbox, int]) -> None:
+        client, inbox, server_port = udp_pair
+        client.send(INVITE_MSG, ("127.0.0.1", server_port))
+
+        await inbox.wait_for(1)
+        assert len(inbox.messages) == 1
+        msg, addr = inbox.messages[0]
+        assert isinstance(msg, SipRequest)
+        assert msg.method == "INVITE"
+        assert addr[0] == "127.0.0.1"
+
     @pytest.mark.asyncio
-    async def test_send_receive(self) -> None:
-        received: list[tuple[SipRequest | SipResponse, tuple[str, int]]] = []
-        event = asyncio.Event()
+    async def test_send_response(self, udp_pair: tuple[UdpSipTransport, _Inbox, int]) -> None:
+        client, inbox, server_port = udp_pair
+        client.send(OK_200_MSG, ("127.0.0.1", server_port))
 
-        def on_msg(msg: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
-            received.append((msg, addr))
-            event.set()
+        await inbox.wait_for(1)
+        assert len(inbox.messages) == 1
+        msg, _ = inbox.messages[0]
+        assert isinstance(msg, SipResponse)
+        assert msg.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_send_reply_via_routing(
+        self, udp_pair: tuple[UdpSipTransport, _Inbox, int]
+    ) -> None:
+        """Test send_reply uses Via-based routing."""
+        sender, inbox, receiver_port = udp_pair
+
+        # Build a response whose Via points to the receiver
+        raw = (
+            "SIP/2.0 200 OK\r\n"
+            f"Via: SIP/2.0/UDP 127.0.0.1:{receiver_port};branch=z9hG4bK-vr1\r\n"
+            "From: <sip:alice@example.com>;tag=aaa\r\n"
+            "To: <sip:bob@example.com>;tag=bbb\r\n"
+            "Call-ID: viaroute@example.com\r\n"
+            "CSeq: 1 INVITE\r\n"
+            "Content-Length: 0\r\n"
+            "\r\n"
+        )
+        response = SipMessage.parse(raw)
+        assert isinstance(response, SipResponse)
+        sender.send_reply(response)
 
-        server = TcpSipTransport(local_addr=("127.0.0.1", 0), on_message=on_msg)
-        await server.start()
+        await inbox.wait_for(1)
+        assert len(inbox.messages) == 1
+        msg, _ = inbox.messages[0]
+        assert isinstance(msg, SipResponse)
+        assert msg.status_code == 200
 
-        assert server._server is not None
-        server_port = server._server.sockets[0].getsockname()[1]
+    def test_send_before_start_raises(self) -> None:
+        transport = UdpSipTransport(local_addr=("127.0.0.1", 0))
+        with pytest.raises(RuntimeError, match="not started"):
+            transport.send(INVITE_MSG, ("127.0.0.1", 5060))
 
-        client = TcpSipTransport(local_addr=("127.0.0.1", 0))
-        await client.connect(("127.0.0.1", server_port))
+    @pytest.mark.asyncio
+    async def test_multiple_messages(self, udp_pair: tuple[UdpSipTransport, _Inbox, int]) -> None:
+        client, inbox, server_port = udp_pair
+        for _ in range(3):
+            client.send(INVITE_MSG, ("127.0.0.1", server_port))
 
-        try:
-            invite = SipMessage.parse(INVITE_RAW)
-            assert isinstance(invite, SipRequest)
-            client.send(invite, ("127.0.0.1", server_port))
+        await inbox.wait_for(3)
+        assert len(inbox.messages) == 3
+        assert all(type(m) is SipRequest and m.method == "INVITE" for m, _ in inbox.messages)
 
-            await asyncio.wait_for(event.wait(), timeout=2.0)
-            assert len(received) == 1
-            msg, _ = received[0]
-            assert isinstance(msg, SipRequest)
-            assert msg.method == "INVITE"
-        finally:
-            await client.stop()
-            await server.stop()
 
+class TestTcpLoopback:
     @pytest.mark.asyncio
-    async def test_message_with_body(self) -> None:
-        received: list[tuple[SipRequest | SipResponse, tuple[str, int]]] = []
-        event = asyncio.Event()
-
-        def on_msg(msg: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
-            received.append((msg, addr))
-            event.set()
-
-        server = TcpSipTransport(local_addr=("127.0.0.1", 0), on_message=on_msg)
-        await server.start()
-
-        assert server._server is not None
-        server_port = server._server.sockets[0].getsockname()[1]
-
-        client = TcpSipTransport(local_addr=("127.0.0.1", 0))
-        await client.connect(("127.0.0.1", server_port))
-
-        try:
-            sdp_body = "v=0\r\no=- 0 0 IN IP4 10.0.0.1\r\ns=-\r\nt=0 0\r\n"
-            raw = (
-                "INVITE sip:bob@example.com SIP/2.0\r\n"
-                "Via: SIP/2.0/TCP 10.0.0.1:5060;branch=z9hG4bK-tcp1\r\n"
-                "From: <sip:alice@example.com>;tag=aaa\r\n"
-                "To: <sip:bob@example.com>\r\n"
-                "Call-ID: tcp-test@example.com\r\n"
-                "CSeq: 1 INVITE\r\n"
-                "Content-Type: application/sdp\r\n"
-                f"Content-Length: {len(sdp_body)}\r\n"
-                "\r\n"
-                f"{sdp_body}"
-            )
-            invite = SipMessage.parse(raw)
-            assert isinstance(invite, SipRequest)
-            client.send(invite, ("127.0.0.1", server_port))
-
-            await asyncio.wait_for(event.wait(), timeout=2.0)
-            assert len(received) == 1
-            msg, _ = received[0]
-            assert isinstance(msg, SipRequest)
-            assert msg.body == sdp_body
-        finally:
-            await client.stop()
-            await server.stop()
+    async def test_send_receive(self, tcp_pair: tuple[TcpSipTransport, _Inbox, int]) -> None:
+        client, inbox, server_port = tcp_pair
+        client.send(INVITE_MSG, ("127.0.0.1", server_port))
+
+        await inbox.wait_for(1)
+        assert len(inbox.messages) == 1
+        msg, _ = inbox.messages[0]
+        assert isinstance(msg, SipRequest)
+        assert msg.method == "INVITE"
 
     @pytest.mark.asyncio
-    async def test_multiple_messages_on_same_connection(self) -> None:
-        received: list[SipRequest | SipResponse] = []
-        all_received = asyncio.Event()
-
-        def on_msg(msg: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
-            received.append(msg)
-            if len(received) >= 3:
-                all_received.set()
-
-        server = TcpSipTransport(local_addr=("127.0.0.1", 0), on_message=on_msg)
-        await server.start()
-
-        assert server._server is not None
-        server_port = server._server.sockets[0].getsockname()[1]
-
-        client = TcpSipTransport(local_addr=("127.0.0.1", 0))
-        await client.connect(("127.0.0.1", server_port))
-
-        try:
-            invite = SipMessage.parse(INVITE_RAW)
-            assert isinstance(invite, SipRequest)
-            for _ in range(3):
-                client.send(invite, ("127.0.0.1", server_port))
-
-            await asyncio.wait_for(all_received.wait(), timeout=2.0)
-            assert len(received) == 3
-            for msg in received:
-                assert isinstance(msg, SipRequest)
-                assert msg.method == "INVITE"
-        finally:
-            await client.stop()
-            await server.stop()
+    async def test_message_with_body(self, tcp_pair: tuple[TcpSipTransport, _Inbox, int]) -> None:
+        client, inbox, server_port = tcp_pair
+        sdp_body = "v=0\r\no=- 0 0 IN IP4 10.0.0.1\r\ns=-\r\nt=0 0\r\n"
+        raw = (
+            "INVITE sip:bob@example.com SIP/2.0\r\n"
+            "Via: SIP/2.0/TCP 10.0.0.1:5060;branch=z9hG4bK-tcp1\r\n"
+            "From: <sip:alice@example.com>;tag=aaa\r\n"
+            "To: <sip:bob@example.com>\r\n"
+            "Call-ID: tcp-test@example.com\r\n"
+            "CSeq: 1 INVITE\r\n"
+            "Content-Type: application/sdp\r\n"
+            f"Content-Length: {len(sdp_body)}\r\n"
+            "\r\n"
+            f"{sdp_body}"
+        )
+        invite = SipMessage.parse(raw)
+        assert isinstance(invite, SipRequest)
+        client.send(invite, ("127.0.0.1", server_port))
+
+        await inbox.wait_for(1)
+        assert len(inbox.messages) == 1
+        msg, _ = inbox.messages[0]
+        assert isinstance(msg, SipRequest)
+        assert msg.body == sdp_body
 
     @pytest.mark.asyncio
-    async def test_no_connection_raises(self) -> None:
+    async def test_multiple_messages_on_same_connection(
+        self, tcp_pair: tuple[TcpSipTransport, _Inbox, int]
+    ) -> None:
+        client, inbox, server_port = tcp_pair
+        for _ in range(3):
+            client.send(INVITE_MSG, ("127.0.0.1", server_port))
+
+        await inbox.wait_for(3)
+        assert len(inbox.messages) == 3
+        assert all(type(m) is SipRequest and m.method == "INVITE" for m, _ in inbox.messages)
+
+    def test_no_connection_raises(self) -> None:
         transport = TcpSipTransport(local_addr=("127.0.0.1", 0))
-        invite = SipMessage.parse(INVITE_RAW)
-        assert isinstance(invite, SipRequest)
         with pytest.raises(RuntimeError, match="No TCP connection"):
-            transport.send(invite, ("127.0.0.1", 5060))
+            transport.send(INVITE_MSG, ("127.0.0.1", 5060))
+
+
+def _reader(data: bytes) -> asyncio.StreamReader:
+    """A stream reader that yields *data* and then EOF, as a closed TCP peer would."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
 
 
 class TestReadSipMessage:
     @pytest.mark.asyncio
     async def test_read_no_body(self) -> None:
-        raw = INVITE_RAW.encode()
-        reader = asyncio.StreamReader()
-        reader.feed_data(raw)
-        reader.feed_eof()
+        reader = _reader(INVITE_RAW_BYTES)
 
         data = await _read_sip_message(reader)
         assert data is not None
@@ -402,9 +303,7 @@ class TestReadSipMessage:
             "\r\n"
             f"{body}"
         ).encode()
-        reader = asyncio.StreamReader()
-        reader.feed_data(raw)
-        reader.feed_eof()
+        reader = _reader(raw)
 
         data = await _read_sip_message(reader)
         assert data is not None
@@ -414,8 +313,7 @@ class TestReadSipMessage:
 
     @pytest.mark.asyncio
     async def test_read_eof_returns_none(self) -> None:
-        reader = asyncio.StreamReader()
-        reader.feed_eof()
+        reader = _reader(b"")
 
         data = await _read_sip_message(reader)
         assert data is None
@@ -430,9 +328,7 @@ class TestReadSipMessage:
             "\r\n"
             f"{body}"
         ).encode()
-        reader = asyncio.StreamReader()
-        reader.feed_data(raw)
-        reader.feed_eof()
+        reader = _reader(raw)
 
         data = await _read_sip_message(reader)
         assert data is not None
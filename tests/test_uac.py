@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 
 import pytest
 
@@ -12,41 +13,10 @@ from aiosipua.sdp import build_sdp, negotiate_sdp, parse_sdp, serialize_sdp
 from aiosipua.uac import OutgoingCall, SipDigestAuth, SipUAC
 from aiosipua.uas import IncomingCall, SipUAS
 
-# --- Fake transport ---
-
-
-class FakeTransport:
-    """Minimal transport that captures sent messages."""
-
-    def __init__(self, local_addr: tuple[str, int] = ("10.0.0.2", 5060)) -> None:
-        self.local_addr = local_addr
-        self.on_message = None
-        self.sent: list[tuple[SipRequest | SipResponse, tuple[str, int]]] = []
-        self._started = False
-
-    async def start(self) -> None:
-        self._started = True
-
-    async def stop(self) -> None:
-        self._started = False
-
-    def send(self, message: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
-        self.sent.append((message, addr))
-
-    def send_reply(self, response: SipResponse) -> None:
-        self.sent.append((response, ("0.0.0.0", 0)))
-
-    def inject(self, raw: str, addr: tuple[str, int] = ("10.0.0.1", 5060)) -> None:
-        """Simulate receiving a SIP message."""
-        msg = SipMessage.parse(raw)
-        if self.on_message is not None:
-            self.on_message(msg, addr)
-
+from .conftest import REMOTE_ADDR, FakeTransport
 
 # --- Helpers ---
 
-REMOTE_ADDR = ("10.0.0.1", 5060)
-
 INVITE_WITH_SDP = (
     "INVITE sip:bob@10.0.0.2:5060 SIP/2.0\r\n"
     "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-inv-1;rport\r\n"
@@ -87,18 +57,27 @@ INVITE_WITH_ROUTES = (
     "\r\n"
 )
 
+# Local SDP offer; only serialized by the UAC, so tests share it (copy before mutating).
+OFFER_SDP = build_sdp("10.0.0.2", 30000, 0, "PCMU")
+# The remote side's answer, as it appears in a 200 OK body.
+ANSWER_SDP_BODY = serialize_sdp(build_sdp("10.0.0.1", 20000, 0, "PCMU"))
+
+# Parsed once and shared: the UAS only reads an incoming INVITE, never mutates it.
+INVITE_WITH_SDP_MSG = SipMessage.parse(INVITE_WITH_SDP)
+INVITE_WITH_ROUTES_MSG = SipMessage.parse(INVITE_WITH_ROUTES)
+
 
 def _establish_call(
     transport: FakeTransport,
-    invite_raw: str = INVITE_WITH_SDP,
+    invite: SipRequest | SipResponse = INVITE_WITH_SDP_MSG,
 ) -> tuple[SipUAS, IncomingCall]:
     """Set up a UAS, inject an INVITE, and accept the call."""
     uas = SipUAS(transport)  # type: ignore[arg-type]
     calls: list[IncomingCall] = []
-    uas.on_invite = lambda call: calls.append(call)
+    uas.on_invite = calls.append
     transport.on_message = uas._on_message
 
-    transport.inject(invite_raw)
+    transport.inject(invite)
     call = calls[0]
 
     # Accept (negotiate SDP if present)
@@ -111,6 +90,50 @@ def _establish_call(
     return uas, call
 
 
+@pytest.fixture(scope="module")
+def established_call_sdp() -> tuple[SipUAS, IncomingCall]:
+    """One accepted call from INVITE_WITH_SDP, shared by the module."""
+    return _establish_call(FakeTransport())
+
+
+@pytest.fixture(scope="module")
+def established_call_routes() -> tuple[SipUAS, IncomingCall]:
+    """One accepted call from INVITE_WITH_ROUTES, shared by the module."""
+    return _establish_call(FakeTransport(), INVITE_WITH_ROUTES_MSG)
+
+
+@pytest.fixture()
+def confirmed_dialog(established_call_sdp: tuple[SipUAS, IncomingCall]) -> Dialog:
+    """A private copy of the shared call's confirmed dialog."""
+    return copy.deepcopy(established_call_sdp[1].dialog)
+
+
+@pytest.fixture()
+def routed_dialog(established_call_routes: tuple[SipUAS, IncomingCall]) -> Dialog:
+    """A private copy of the shared call's confirmed dialog, with a route set."""
+    return copy.deepcopy(established_call_routes[1].dialog)
+
+
+def _make_ack(local_tag: str) -> SipRequest:
+    """Build the caller's ACK for the INVITE_WITH_SDP call, answered with *local_tag*."""
+    ack = SipRequest(method="ACK", uri="sip:bob@10.0.0.2:5060")
+    ack.headers.append("Via", "SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-ack-1")
+    ack.headers.set_single("From", "<sip:alice@example.com>;tag=from-tag-1")
+    ack.headers.set_single("To", f"<sip:bob@example.com>;tag={local_tag}")
+    ack.headers.set_single("Call-ID", "uac-test-1@example.com")
+    ack.headers.set_single("CSeq", "1 ACK")
+    ack.headers.set_single("Max-Forwards", "70")
+    ack.headers.set_single("Content-Length", "0")
+    return ack
+
+
+def _sent_request(transport: FakeTransport, index: int = 0) -> tuple[SipRequest, tuple[str, int]]:
+    """Return a captured request and its destination, checking it is a request."""
+    msg, addr = transport.sent[index]
+    assert msg.kind == SipMessage.KIND_REQUEST
+    return msg, addr
+
+
 def _make_response(
     invite: SipRequest,
     status_code: int,
@@ -158,44 +181,46 @@ def _make_response(
 # --- Tests: Existing in-dialog requests ---
 
 
-class TestSendBye:
-    def test_bye_sends_request(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-        transport.sent.clear()
-
+class TestSendInDialogRequest:
+    @pytest.mark.parametrize(
+        ("kind", "args", "method"),
+        [
+            ("bye", (), "BYE"),
+            ("reinvite", (OFFER_SDP,), "INVITE"),
+            ("info", ("Signal=1\r\nDuration=250\r\n", "application/dtmf-relay"), "INFO"),
+        ],
+        ids=["bye", "reinvite", "info"],
+    )
+    def test_sends_request(
+        self,
+        transport: FakeTransport,
+        confirmed_dialog: Dialog,
+        kind: str,
+        args: tuple[object, ...],
+        method: str,
+    ) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        bye = uac.send_bye(call.dialog, REMOTE_ADDR)
+        req = getattr(uac, f"send_{kind}")(confirmed_dialog, *args, REMOTE_ADDR)
 
-        assert bye.method == "BYE"
+        assert req.method == method
         assert len(transport.sent) == 1
-        msg, addr = transport.sent[0]
-        assert isinstance(msg, SipRequest)
-        assert msg.method == "BYE"
+        msg, addr = _sent_request(transport)
+        assert msg is req
         assert addr == REMOTE_ADDR
 
-    def test_bye_terminates_dialog(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-
-        uac = SipUAC(transport)  # type: ignore[arg-type]
-        uac.send_bye(call.dialog, REMOTE_ADDR)
-
-        assert call.dialog.state == DialogState.TERMINATED
-
-    def test_bye_has_correct_headers(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-        transport.sent.clear()
 
+class TestSendBye:
+    def test_bye_headers_and_state(
+        self, transport: FakeTransport, confirmed_dialog: Dialog
+    ) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        bye = uac.send_bye(call.dialog, REMOTE_ADDR)
+        bye = uac.send_bye(confirmed_dialog, REMOTE_ADDR)
 
         assert bye.call_id == "uac-test-1@example.com"
         # From should be our local URI with local tag
         from_val = bye.get_header("from")
         assert from_val is not None
-        assert f"tag={call.dialog.local_tag}" in from_val
+        assert f"tag={confirmed_dialog.local_tag}" in from_val
         # To should be remote URI with remote tag
         to_val = bye.get_header("to")
         assert to_val is not None
@@ -210,20 +235,18 @@ class TestSendBye:
         assert contact is not None
         assert "10.0.0.2:5060" in contact
 
-    def test_bye_requires_confirmed_dialog(self) -> None:
-        transport = FakeTransport()
+        # Dialog is terminated
+        assert confirmed_dialog.state == DialogState.TERMINATED
+
+    def test_bye_requires_confirmed_dialog(self, transport: FakeTransport) -> None:
         dialog = Dialog(call_id="test", local_tag="l", remote_tag="r", state=DialogState.EARLY)
         uac = SipUAC(transport)  # type: ignore[arg-type]
         with pytest.raises(ValueError, match="expected confirmed"):
             uac.send_bye(dialog, REMOTE_ADDR)
 
-    def test_bye_with_route_set(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport, INVITE_WITH_ROUTES)
-        transport.sent.clear()
-
+    def test_bye_with_route_set(self, transport: FakeTransport, routed_dialog: Dialog) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        bye = uac.send_bye(call.dialog, REMOTE_ADDR)
+        bye = uac.send_bye(routed_dialog, REMOTE_ADDR)
 
         # Route set should be reversed Record-Route from INVITE
         routes = bye.get_header_values("route")
@@ -234,30 +257,11 @@ class TestSendBye:
 
 
 class TestSendReinvite:
-    def test_reinvite_sends_request(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-        transport.sent.clear()
-
-        uac = SipUAC(transport)  # type: ignore[arg-type]
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
-        invite = uac.send_reinvite(call.dialog, sdp, REMOTE_ADDR)
-
-        assert invite.method == "INVITE"
-        assert len(transport.sent) == 1
-        msg, addr = transport.sent[0]
-        assert isinstance(msg, SipRequest)
-        assert msg.method == "INVITE"
-        assert addr == REMOTE_ADDR
-
-    def test_reinvite_has_sdp_body(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-        transport.sent.clear()
-
+    def test_reinvite_has_sdp_body(
+        self, transport: FakeTransport, confirmed_dialog: Dialog
+    ) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
-        invite = uac.send_reinvite(call.dialog, sdp, REMOTE_ADDR)
+        invite = uac.send_reinvite(confirmed_dialog, OFFER_SDP, REMOTE_ADDR)
 
         assert invite.content_type == "application/sdp"
         assert invite.body != ""
@@ -266,105 +270,89 @@ class TestSendReinvite:
         assert parsed.audio is not None
         assert parsed.audio.port == 30000
 
-    def test_reinvite_has_contact(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-        transport.sent.clear()
-
+    def test_reinvite_has_contact(
+        self, transport: FakeTransport, confirmed_dialog: Dialog
+    ) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
-        invite = uac.send_reinvite(call.dialog, sdp, REMOTE_ADDR)
+        invite = uac.send_reinvite(confirmed_dialog, OFFER_SDP, REMOTE_ADDR)
 
         contact = invite.get_header("contact")
         assert contact is not None
         assert "10.0.0.2:5060" in contact
 
-    def test_reinvite_requires_confirmed(self) -> None:
-        transport = FakeTransport()
+    def test_reinvite_requires_confirmed(self, transport: FakeTransport) -> None:
         dialog = Dialog(call_id="test", local_tag="l", remote_tag="r", state=DialogState.EARLY)
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
         with pytest.raises(ValueError, match="expected confirmed"):
-            uac.send_reinvite(dialog, sdp, REMOTE_ADDR)
-
-    def test_reinvite_increments_cseq(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-        transport.sent.clear()
+            uac.send_reinvite(dialog, OFFER_SDP, REMOTE_ADDR)
 
+    def test_reinvite_increments_cseq(
+        self, transport: FakeTransport, confirmed_dialog: Dialog
+    ) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
 
-        inv1 = uac.send_reinvite(call.dialog, sdp, REMOTE_ADDR)
-        inv2 = uac.send_reinvite(call.dialog, sdp, REMOTE_ADDR)
+        inv1 = uac.send_reinvite(confirmed_dialog, OFFER_SDP, REMOTE_ADDR)
+        inv2 = uac.send_reinvite(confirmed_dialog, OFFER_SDP, REMOTE_ADDR)
 
         c1 = inv1.cseq
         c2 = inv2.cseq
         assert c1 is not None and c2 is not None
         assert c2.seq == c1.seq + 1
 
-    def test_reinvite_hold(self) -> None:
+    def test_reinvite_hold(self, transport: FakeTransport, confirmed_dialog: Dialog) -> None:
         """Hold scenario: re-INVITE with sendonly direction."""
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-        transport.sent.clear()
 
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
+        sdp = copy.deepcopy(OFFER_SDP)
         # Modify SDP for hold: change direction to sendonly
         audio = sdp.audio
         assert audio is not None
         audio.attributes.pop("sendrecv", None)
         audio.attributes["sendonly"] = []
 
-        invite = uac.send_reinvite(call.dialog, sdp, REMOTE_ADDR)
+        invite = uac.send_reinvite(confirmed_dialog, sdp, REMOTE_ADDR)
         parsed = parse_sdp(invite.body)
         assert parsed.audio is not None
         assert parsed.audio.direction == "sendonly"
 
 
-class TestSendCancel:
-    def test_cancel_sends_request(self) -> None:
-        transport = FakeTransport()
-        dialog = Dialog(
-            call_id="cancel-test",
-            local_tag="l",
-            remote_tag="r",
-            local_uri="sip:bob@example.com",
-            remote_uri="sip:alice@example.com",
-            remote_target="sip:alice@10.0.0.1:5060",
-            state=DialogState.EARLY,
-        )
+@pytest.fixture()
+def early_cancel_dialog() -> Dialog:
+    """An early (unanswered) dialog, fresh per test since CANCEL terminates it."""
+    return Dialog(
+        call_id="cancel-test",
+        local_tag="l",
+        remote_tag="r",
+        local_uri="sip:bob@example.com",
+        remote_uri="sip:alice@example.com",
+        remote_target="sip:alice@10.0.0.1:5060",
+        state=DialogState.EARLY,
+    )
+
 
+class TestSendCancel:
+    def test_cancel_sends_request(
+        self, transport: FakeTransport, early_cancel_dialog: Dialog
+    ) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        cancel = uac.send_cancel(dialog, REMOTE_ADDR)
+        cancel = uac.send_cancel(early_cancel_dialog, REMOTE_ADDR)
 
         assert cancel.method == "CANCEL"
         assert len(transport.sent) == 1
-        msg, addr = transport.sent[0]
-        assert isinstance(msg, SipRequest)
+        msg, addr = _sent_request(transport)
         assert msg.method == "CANCEL"
         assert addr == REMOTE_ADDR
 
-    def test_cancel_terminates_dialog(self) -> None:
-        transport = FakeTransport()
-        dialog = Dialog(
-            call_id="cancel-test",
-            local_tag="l",
-            remote_tag="r",
-            local_uri="sip:bob@example.com",
-            remote_uri="sip:alice@example.com",
-            remote_target="sip:alice@10.0.0.1:5060",
-            state=DialogState.EARLY,
-        )
-
-        uac = SipUAC(transport)  # type: ignore[arg-type]
-        uac.send_cancel(dialog, REMOTE_ADDR)
+        # Headers
+        assert cancel.call_id == "cancel-test"
+        cseq = cancel.cseq
+        assert cseq is not None
+        assert cseq.method == "CANCEL"
 
-        assert dialog.state == DialogState.TERMINATED
+        # Dialog is terminated
+        assert early_cancel_dialog.state == DialogState.TERMINATED
 
-    def test_cancel_requires_early_dialog(self) -> None:
-        transport = FakeTransport()
+    def test_cancel_requires_early_dialog(self, transport: FakeTransport) -> None:
         dialog = Dialog(
             call_id="test",
             local_tag="l",
@@ -375,56 +363,12 @@ class TestSendCancel:
         with pytest.raises(ValueError, match="expected early"):
             uac.send_cancel(dialog, REMOTE_ADDR)
 
-    def test_cancel_has_correct_headers(self) -> None:
-        transport = FakeTransport()
-        dialog = Dialog(
-            call_id="cancel-hdr",
-            local_tag="ltag",
-            remote_tag="rtag",
-            local_uri="sip:bob@example.com",
-            remote_uri="sip:alice@example.com",
-            remote_target="sip:alice@10.0.0.1:5060",
-            state=DialogState.EARLY,
-        )
-
-        uac = SipUAC(transport)  # type: ignore[arg-type]
-        cancel = uac.send_cancel(dialog, REMOTE_ADDR)
-
-        assert cancel.call_id == "cancel-hdr"
-        cseq = cancel.cseq
-        assert cseq is not None
-        assert cseq.method == "CANCEL"
-
 
 class TestSendInfo:
-    def test_info_sends_request(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-        transport.sent.clear()
-
+    def test_info_has_body(self, transport: FakeTransport, confirmed_dialog: Dialog) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         info = uac.send_info(
-            call.dialog,
-            "Signal=1\r\nDuration=250\r\n",
-            "application/dtmf-relay",
-            REMOTE_ADDR,
-        )
-
-        assert info.method == "INFO"
-        assert len(transport.sent) == 1
-        msg, addr = transport.sent[0]
-        assert isinstance(msg, SipRequest)
-        assert msg.method == "INFO"
-        assert addr == REMOTE_ADDR
-
-    def test_info_has_body(self) -> None:
-        transport = FakeTransport()
-        _, call = _establish_call(transport)
-        transport.sent.clear()
-
-        uac = SipUAC(transport)  # type: ignore[arg-type]
-        info = uac.send_info(
-            call.dialog,
+            confirmed_dialog,
             "Signal=1\r\nDuration=250\r\n",
             "application/dtmf-relay",
             REMOTE_ADDR,
@@ -433,8 +377,7 @@ class TestSendInfo:
         assert info.content_type == "application/dtmf-relay"
         assert "Signal=1" in info.body
 
-    def test_info_requires_confirmed(self) -> None:
-        transport = FakeTransport()
+    def test_info_requires_confirmed(self, transport: FakeTransport) -> None:
         dialog = Dialog(call_id="test", local_tag="l", remote_tag="r", state=DialogState.EARLY)
         uac = SipUAC(transport)  # type: ignore[arg-type]
         with pytest.raises(ValueError, match="expected confirmed"):
@@ -444,24 +387,12 @@ class TestSendInfo:
 class TestBackendInitiatedBye:
     """Integration test: full call flow with backend-initiated BYE."""
 
-    def test_establish_and_backend_bye(self) -> None:
-        transport = FakeTransport()
+    def test_establish_and_backend_bye(self, transport: FakeTransport) -> None:
         uas, call = _establish_call(transport)
         local_tag = call.dialog.local_tag
 
         # Inject ACK to fully confirm
-        ack_raw = (
-            "ACK sip:bob@10.0.0.2:5060 SIP/2.0\r\n"
-            "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-ack-1\r\n"
-            f"From: <sip:alice@example.com>;tag=from-tag-1\r\n"
-            f"To: <sip:bob@example.com>;tag={local_tag}\r\n"
-            "Call-ID: uac-test-1@example.com\r\n"
-            "CSeq: 1 ACK\r\n"
-            "Max-Forwards: 70\r\n"
-            "Content-Length: 0\r\n"
-            "\r\n"
-        )
-        transport.inject(ack_raw)
+        transport.inject(_make_ack(local_tag))
         assert call.dialog.state == DialogState.CONFIRMED
 
         transport.sent.clear()
@@ -472,8 +403,7 @@ class TestBackendInitiatedBye:
 
         # Verify BYE was sent
         assert len(transport.sent) == 1
-        msg, addr = transport.sent[0]
-        assert isinstance(msg, SipRequest)
+        msg, addr = _sent_request(transport)
         assert msg.method == "BYE"
         assert addr == REMOTE_ADDR
 
@@ -489,10 +419,9 @@ class TestBackendInitiatedBye:
         # Dialog should be terminated
         assert call.dialog.state == DialogState.TERMINATED
 
-    def test_establish_and_backend_bye_with_routes(self) -> None:
+    def test_establish_and_backend_bye_with_routes(self, transport: FakeTransport) -> None:
         """BYE through proxy chain uses route_set from Record-Route."""
-        transport = FakeTransport()
-        uas, call = _establish_call(transport, INVITE_WITH_ROUTES)
+        uas, call = _establish_call(transport, INVITE_WITH_ROUTES_MSG)
 
         # Verify route set was captured from Record-Route (reversed)
         assert len(call.dialog.route_set) == 2
@@ -519,8 +448,7 @@ class TestBackendInitiatedBye:
 
 
 class TestSendInvite:
-    def test_send_invite_creates_invite(self) -> None:
-        transport = FakeTransport()
+    def test_send_invite_creates_invite(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         call = uac.send_invite(
@@ -533,21 +461,18 @@ class TestSendInvite:
         assert call.dialog.state == DialogState.EARLY
         assert call.remote_addr == REMOTE_ADDR
 
-    def test_send_invite_sends_request(self) -> None:
-        transport = FakeTransport()
+    def test_send_invite_sends_request(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         uac.send_invite("sip:me@example.com", "sip:them@example.com", REMOTE_ADDR)
 
         assert len(transport.sent) == 1
-        msg, addr = transport.sent[0]
-        assert isinstance(msg, SipRequest)
+        msg, addr = _sent_request(transport)
         assert msg.method == "INVITE"
         assert msg.uri == "sip:them@example.com"
         assert addr == REMOTE_ADDR
 
-    def test_send_invite_headers(self) -> None:
-        transport = FakeTransport()
+    def test_send_invite_headers(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         call = uac.send_invite(
@@ -592,27 +517,24 @@ class TestSendInvite:
         assert contact is not None
         assert "10.0.0.2:5060" in contact
 
-    def test_send_invite_with_sdp(self) -> None:
-        transport = FakeTransport()
+    def test_send_invite_with_sdp(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR,
-            sdp_offer=sdp,
+            sdp_offer=OFFER_SDP,
         )
 
         assert call.invite.content_type == "application/sdp"
         assert call.invite.body != ""
-        assert call.sdp_offer is sdp
+        assert call.sdp_offer is OFFER_SDP
 
         # Verify SDP is parseable
         parsed = parse_sdp(call.invite.body)
         assert parsed.audio is not None
         assert parsed.audio.port == 30000
 
-    def test_send_invite_without_sdp(self) -> None:
-        transport = FakeTransport()
+    def test_send_invite_without_sdp(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         call = uac.send_invite(
@@ -622,8 +544,7 @@ class TestSendInvite:
         assert call.invite.body == ""
         assert call.sdp_offer is None
 
-    def test_send_invite_extra_headers(self) -> None:
-        transport = FakeTransport()
+    def test_send_invite_extra_headers(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         call = uac.send_invite(
@@ -634,8 +555,7 @@ class TestSendInvite:
         assert call.invite.get_header("x-room-id") == "room-42"
         assert call.invite.get_header("x-session-id") == "sess-1"
 
-    def test_send_invite_user_agent(self) -> None:
-        transport = FakeTransport()
+    def test_send_invite_user_agent(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         call = uac.send_invite(
@@ -646,8 +566,7 @@ class TestSendInvite:
         assert call.invite.get_header("user-agent") == "RoomKit/1.0"
         assert call.user_agent == "RoomKit/1.0"
 
-    def test_send_invite_stored_in_calls(self) -> None:
-        transport = FakeTransport()
+    def test_send_invite_stored_in_calls(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         call = uac.send_invite(
@@ -656,8 +575,7 @@ class TestSendInvite:
 
         assert uac.get_call(call.call_id) is call
 
-    def test_send_invite_creates_client_transaction(self) -> None:
-        transport = FakeTransport()
+    def test_send_invite_creates_client_transaction(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         uac.send_invite("sip:me@example.com", "sip:them@example.com", REMOTE_ADDR)
@@ -673,10 +591,9 @@ class TestHandleResponse:
     ) -> tuple[FakeTransport, SipUAC, OutgoingCall]:
         transport = FakeTransport()
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR,
-            sdp_offer=sdp,
+            sdp_offer=OFFER_SDP,
         )
         return transport, uac, call
 
@@ -710,7 +627,7 @@ class TestHandleResponse:
     def test_180_ringing_fires_callback(self) -> None:
         transport, uac, call = self._make_uac_and_call()
         ringing_events: list[OutgoingCall] = []
-        call.on_ringing = lambda c: ringing_events.append(c)
+        call.on_ringing = ringing_events.append
 
         raw = _make_response(call.invite, 180, "Ringing", remote_tag="rtag")
         resp = SipMessage.parse(raw)
@@ -724,7 +641,7 @@ class TestHandleResponse:
     def test_183_session_progress(self) -> None:
         transport, uac, call = self._make_uac_and_call()
         ringing_events: list[OutgoingCall] = []
-        call.on_ringing = lambda c: ringing_events.append(c)
+        call.on_ringing = ringing_events.append
 
         raw = _make_response(call.invite, 183, "Session Progress", remote_tag="rtag")
         resp = SipMessage.parse(raw)
@@ -739,8 +656,7 @@ class TestHandleResponse:
         transport, uac, call = self._make_uac_and_call()
         remote_tag = "remote-tag-200"
 
-        sdp_answer = build_sdp("10.0.0.1", 20000, 0, "PCMU")
-        sdp_body = serialize_sdp(sdp_answer)
+        sdp_body = ANSWER_SDP_BODY
 
         raw = _make_response(
             call.invite, 200, "OK",
@@ -760,8 +676,7 @@ class TestHandleResponse:
     def test_200_ok_parses_sdp_answer(self) -> None:
         transport, uac, call = self._make_uac_and_call()
 
-        sdp_answer = build_sdp("10.0.0.1", 20000, 0, "PCMU")
-        sdp_body = serialize_sdp(sdp_answer)
+        sdp_body = ANSWER_SDP_BODY
 
         raw = _make_response(
             call.invite, 200, "OK",
@@ -789,8 +704,7 @@ class TestHandleResponse:
 
         # Should have sent an ACK
         assert len(transport.sent) == 1
-        ack_msg, ack_addr = transport.sent[0]
-        assert isinstance(ack_msg, SipRequest)
+        ack_msg, ack_addr = _sent_request(transport)
         assert ack_msg.method == "ACK"
         assert ack_addr == REMOTE_ADDR
 
@@ -813,7 +727,7 @@ class TestHandleResponse:
     def test_200_ok_fires_callback(self) -> None:
         transport, uac, call = self._make_uac_and_call()
         answer_events: list[OutgoingCall] = []
-        call.on_answer = lambda c: answer_events.append(c)
+        call.on_answer = answer_events.append
 
         raw = _make_response(call.invite, 200, "OK", remote_tag="rtag")
         resp = SipMessage.parse(raw)
@@ -869,8 +783,7 @@ class TestHandleResponse:
         assert len(reject_events) == 1
         assert reject_events[0] == (call, 486, "Busy Here")
 
-    def test_unknown_call_id_ignored(self) -> None:
-        transport = FakeTransport()
+    def test_unknown_call_id_ignored(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         resp = SipResponse(status_code=200, reason_phrase="OK")
@@ -883,8 +796,7 @@ class TestHandleResponse:
 
 
 class TestOutgoingCallMethods:
-    def test_cancel_early_dialog(self) -> None:
-        transport = FakeTransport()
+    def test_cancel_early_dialog(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
@@ -898,8 +810,7 @@ class TestOutgoingCallMethods:
         assert call.dialog.state == DialogState.TERMINATED
         assert uac.get_call(call.call_id) is None
 
-    def test_cancel_confirmed_returns_none(self) -> None:
-        transport = FakeTransport()
+    def test_cancel_confirmed_returns_none(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
@@ -911,8 +822,7 @@ class TestOutgoingCallMethods:
         result = call.cancel(uac)
         assert result is None
 
-    def test_hangup_confirmed_dialog(self) -> None:
-        transport = FakeTransport()
+    def test_hangup_confirmed_dialog(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
@@ -933,8 +843,7 @@ class TestOutgoingCallMethods:
         assert result.method == "BYE"
         assert call.dialog.state == DialogState.TERMINATED
 
-    def test_hangup_early_returns_none(self) -> None:
-        transport = FakeTransport()
+    def test_hangup_early_returns_none(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
@@ -943,8 +852,7 @@ class TestOutgoingCallMethods:
         result = call.hangup(uac)
         assert result is None
 
-    def test_call_properties(self) -> None:
-        transport = FakeTransport()
+    def test_call_properties(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
@@ -957,8 +865,7 @@ class TestOutgoingCallMethods:
 
 class TestWaitAnswered:
     @pytest.mark.asyncio()
-    async def test_wait_answered_success(self) -> None:
-        transport = FakeTransport()
+    async def test_wait_answered_success(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
@@ -979,8 +886,7 @@ class TestWaitAnswered:
         assert call.dialog.state == DialogState.CONFIRMED
 
     @pytest.mark.asyncio()
-    async def test_wait_answered_rejected(self) -> None:
-        transport = FakeTransport()
+    async def test_wait_answered_rejected(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
@@ -999,8 +905,7 @@ class TestWaitAnswered:
             await call.wait_answered(timeout=2.0)
 
     @pytest.mark.asyncio()
-    async def test_wait_answered_timeout(self) -> None:
-        transport = FakeTransport()
+    async def test_wait_answered_timeout(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
@@ -1013,8 +918,7 @@ class TestWaitAnswered:
 class TestUASResponseForwarding:
     """Test that SipUAS forwards SipResponse to UAC."""
 
-    def test_uas_forwards_response_to_uac(self) -> None:
-        transport = FakeTransport()
+    def test_uas_forwards_response_to_uac(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         uas = SipUAS(transport, uac=uac)  # type: ignore[arg-type]
         transport.on_message = uas._on_message
@@ -1026,7 +930,7 @@ class TestUASResponseForwarding:
 
         # Inject a 180 Ringing response via UAS transport
         ringing_events: list[OutgoingCall] = []
-        call.on_ringing = lambda c: ringing_events.append(c)
+        call.on_ringing = ringing_events.append
 
         raw = _make_response(call.invite, 180, "Ringing", remote_tag="rtag")
         transport.inject(raw)
@@ -1034,8 +938,7 @@ class TestUASResponseForwarding:
         assert len(ringing_events) == 1
         assert call.dialog.remote_tag == "rtag"
 
-    def test_uas_forwards_200_ok_to_uac(self) -> None:
-        transport = FakeTransport()
+    def test_uas_forwards_200_ok_to_uac(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         uas = SipUAS(transport, uac=uac)  # type: ignore[arg-type]
         transport.on_message = uas._on_message
@@ -1044,8 +947,7 @@ class TestUASResponseForwarding:
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
         )
 
-        sdp_answer = build_sdp("10.0.0.1", 20000, 0, "PCMU")
-        sdp_body = serialize_sdp(sdp_answer)
+        sdp_body = ANSWER_SDP_BODY
 
         raw = _make_response(
             call.invite, 200, "OK",
@@ -1058,8 +960,7 @@ class TestUASResponseForwarding:
         assert call._answered.is_set()
         assert call.sdp_answer is not None
 
-    def test_uas_without_uac_ignores_responses(self) -> None:
-        transport = FakeTransport()
+    def test_uas_without_uac_ignores_responses(self, transport: FakeTransport) -> None:
         uas = SipUAS(transport)  # type: ignore[arg-type]
         transport.on_message = uas._on_message
 
@@ -1080,8 +981,7 @@ class TestUASResponseForwarding:
 class TestFullOutboundCallFlow:
     """Integration: INVITE → 100 → 180 → 200+ACK → BYE."""
 
-    def test_full_outbound_flow(self) -> None:
-        transport = FakeTransport()
+    def test_full_outbound_flow(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         uas = SipUAS(transport, uac=uac)  # type: ignore[arg-type]
         transport.on_message = uas._on_message
@@ -1090,17 +990,17 @@ class TestFullOutboundCallFlow:
         answer_events: list[OutgoingCall] = []
 
         # 1. Send INVITE
-        sdp_offer = build_sdp("10.0.0.2", 30000, 0, "PCMU")
+        sdp_offer = OFFER_SDP
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR,
             sdp_offer=sdp_offer,
         )
-        call.on_ringing = lambda c: ringing_events.append(c)
-        call.on_answer = lambda c: answer_events.append(c)
+        call.on_ringing = ringing_events.append
+        call.on_answer = answer_events.append
 
         # INVITE was sent
         assert len(transport.sent) == 1
-        assert transport.sent[0][0].method == "INVITE"  # type: ignore[union-attr]
+        assert _sent_request(transport)[0].method == "INVITE"
 
         # 2. 100 Trying
         raw_100 = _make_response(call.invite, 100, "Trying")
@@ -1114,8 +1014,7 @@ class TestFullOutboundCallFlow:
         assert call.dialog.remote_tag == "callee-tag"
 
         # 4. 200 OK with SDP answer
-        sdp_answer = build_sdp("10.0.0.1", 20000, 0, "PCMU")
-        sdp_body = serialize_sdp(sdp_answer)
+        sdp_body = ANSWER_SDP_BODY
         raw_200 = _make_response(
             call.invite, 200, "OK",
             remote_tag="callee-tag",
@@ -1131,8 +1030,7 @@ class TestFullOutboundCallFlow:
 
         # ACK was sent
         assert len(transport.sent) == 1
-        ack_msg = transport.sent[0][0]
-        assert isinstance(ack_msg, SipRequest)
+        ack_msg, _ = _sent_request(transport)
         assert ack_msg.method == "ACK"
 
         # 5. Hangup (BYE)
@@ -1143,8 +1041,7 @@ class TestFullOutboundCallFlow:
         assert call.dialog.state == DialogState.TERMINATED
         assert len(transport.sent) == 1
 
-    def test_outbound_call_rejected_flow(self) -> None:
-        transport = FakeTransport()
+    def test_outbound_call_rejected_flow(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         uas = SipUAS(transport, uac=uac)  # type: ignore[arg-type]
         transport.on_message = uas._on_message
@@ -1171,8 +1068,7 @@ class TestFullOutboundCallFlow:
 
 
 class TestRemoveCall:
-    def test_remove_call(self) -> None:
-        transport = FakeTransport()
+    def test_remove_call(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR
@@ -1182,8 +1078,7 @@ class TestRemoveCall:
         uac.remove_call(call.call_id)
         assert uac.get_call(call.call_id) is None
 
-    def test_remove_nonexistent_call(self) -> None:
-        transport = FakeTransport()
+    def test_remove_nonexistent_call(self, transport: FakeTransport) -> None:
         uac = SipUAC(transport)  # type: ignore[arg-type]
         # Should not raise
         uac.remove_call("nonexistent")
@@ -1212,10 +1107,9 @@ class TestDigestAuth:
             auth = SipDigestAuth(username="alice", password="secret")
         transport = FakeTransport()
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR,
-            sdp_offer=sdp,
+            sdp_offer=OFFER_SDP,
             auth=auth,
         )
         return transport, uac, call
@@ -1238,8 +1132,7 @@ class TestDigestAuth:
         # Should have re-sent INVITE (not rejected)
         assert not call._rejected.is_set()
         assert len(transport.sent) == 1
-        retry_msg, retry_addr = transport.sent[0]
-        assert isinstance(retry_msg, SipRequest)
+        retry_msg, retry_addr = _sent_request(transport)
         assert retry_msg.method == "INVITE"
         assert retry_addr == REMOTE_ADDR
 
@@ -1295,8 +1188,7 @@ class TestDigestAuth:
 
         assert not call._rejected.is_set()
         assert len(transport.sent) == 1
-        retry_msg = transport.sent[0][0]
-        assert isinstance(retry_msg, SipRequest)
+        retry_msg, _ = _sent_request(transport)
 
         # Should have Authorization (not Proxy-Authorization)
         auth_header = retry_msg.get_header("authorization")
@@ -1307,11 +1199,10 @@ class TestDigestAuth:
         # Should NOT have Proxy-Authorization
         assert retry_msg.get_header("proxy-authorization") is None
 
-    def test_digest_computation_correctness(self) -> None:
+    def test_digest_computation_correctness(self, transport: FakeTransport) -> None:
         """Verify digest response matches known RFC 2617 computation."""
         import hashlib
 
-        transport = FakeTransport()
         uac = SipUAC(transport)  # type: ignore[arg-type]
 
         result = uac._compute_digest(
@@ -1361,14 +1252,12 @@ class TestDigestAuth:
         assert call._reject_code == 407
         assert uac.get_call(call.call_id) is None
 
-    def test_no_retry_without_credentials(self) -> None:
+    def test_no_retry_without_credentials(self, transport: FakeTransport) -> None:
         """401/407 without auth → immediate rejection."""
-        transport = FakeTransport()
         uac = SipUAC(transport)  # type: ignore[arg-type]
-        sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
         call = uac.send_invite(
             "sip:me@example.com", "sip:them@example.com", REMOTE_ADDR,
-            sdp_offer=sdp,
+            sdp_offer=OFFER_SDP,
             # No auth parameter
         )
         transport.sent.clear()
@@ -1417,8 +1306,7 @@ class TestDigestAuth:
         assert isinstance(resp, SipResponse)
         uac.handle_response(resp, REMOTE_ADDR)
 
-        retry_msg = transport.sent[0][0]
-        assert isinstance(retry_msg, SipRequest)
+        retry_msg, _ = _sent_request(transport)
         assert retry_msg.content_type == "application/sdp"
         assert retry_msg.body != ""
 
@@ -1442,8 +1330,7 @@ class TestDigestAuth:
         assert isinstance(resp, SipResponse)
         uac.handle_response(resp, REMOTE_ADDR)
 
-        retry_msg = transport.sent[0][0]
-        assert isinstance(retry_msg, SipRequest)
+        retry_msg, _ = _sent_request(transport)
         assert retry_msg.call_id == original_call_id
         from_val = retry_msg.get_header("from") or ""
         assert f"tag={original_local_tag}" in from_val
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from aiosipua.dialog import DialogState
@@ -9,38 +11,8 @@ from aiosipua.message import SipMessage, SipRequest, SipResponse
 from aiosipua.sdp import build_sdp, negotiate_sdp
 from aiosipua.uas import IncomingCall, SipUAS
 
-# --- Fake transport for testing ---
-
-
-class FakeTransport:
-    """Minimal SipTransport stand-in that captures sent messages."""
-
-    def __init__(self, local_addr: tuple[str, int] = ("10.0.0.2", 5060)) -> None:
-        self.local_addr = local_addr
-        self.on_message = None
-        self.sent: list[tuple[SipRequest | SipResponse, tuple[str, int]]] = []
-        self._started = False
-
-    async def start(self) -> None:
-        self._started = True
-
-    async def stop(self) -> None:
-        self._started = False
-
-    def send(self, message: SipRequest | SipResponse, addr: tuple[str, int]) -> None:
-        self.sent.append((message, addr))
-
-    def send_reply(self, response: SipResponse) -> None:
-        # In the real transport this uses Via routing; for testing just
-        # store it with a dummy addr.
-        self.sent.append((response, ("0.0.0.0", 0)))
-
-    def inject(self, raw: str, addr: tuple[str, int] = ("10.0.0.1", 5060)) -> None:
-        """Simulate receiving a SIP message."""
-        msg = SipMessage.parse(raw)
-        if self.on_message is not None:
-            self.on_message(msg, addr)
-
+if TYPE_CHECKING:
+    from .conftest import FakeTransport
 
 # --- Test data helpers ---
 
@@ -82,6 +54,25 @@ INVITE_WITH_SDP = (
     "a=sendrecv\r\n"
 )
 
+# INVITE carrying application X- headers (room/session IDs and a custom one)
+X_HEADERS_INVITE = (
+    "INVITE sip:bob@10.0.0.2:5060 SIP/2.0\r\n"
+    "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-x-1;rport\r\n"
+    "From: <sip:alice@example.com>;tag=xtag\r\n"
+    "To: <sip:bob@example.com>\r\n"
+    "Call-ID: x-call@example.com\r\n"
+    "CSeq: 1 INVITE\r\n"
+    "Contact: <sip:alice@10.0.0.1:5060>\r\n"
+    "X-Room-ID: room-42\r\n"
+    "X-Session-ID: sess-99\r\n"
+    "X-Custom: custom-val\r\n"
+    "Content-Length: 0\r\n"
+    "\r\n"
+)
+
+INVITE_MSG = SipMessage.parse(INVITE_RAW)
+INVITE_WITH_SDP_MSG = SipMessage.parse(INVITE_WITH_SDP)
+
 
 def _make_ack(call_id: str, from_tag: str, to_tag: str) -> str:
     return (
@@ -125,18 +116,24 @@ def _make_cancel(call_id: str, from_tag: str) -> str:
     )
 
 
-def _make_options() -> str:
-    return (
-        "OPTIONS sip:bob@10.0.0.2:5060 SIP/2.0\r\n"
-        "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-opt-1;rport\r\n"
-        "From: <sip:alice@example.com>;tag=opt-tag\r\n"
-        "To: <sip:bob@example.com>\r\n"
-        "Call-ID: options-1@example.com\r\n"
-        "CSeq: 1 OPTIONS\r\n"
-        "Max-Forwards: 70\r\n"
-        "Content-Length: 0\r\n"
-        "\r\n"
-    )
+OPTIONS_MSG = SipMessage.parse(
+    "OPTIONS sip:bob@10.0.0.2:5060 SIP/2.0\r\n"
+    "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-opt-1;rport\r\n"
+    "From: <sip:alice@example.com>;tag=opt-tag\r\n"
+    "To: <sip:bob@example.com>\r\n"
+    "Call-ID: options-1@example.com\r\n"
+    "CSeq: 1 OPTIONS\r\n"
+    "Max-Forwards: 70\r\n"
+    "Content-Length: 0\r\n"
+    "\r\n"
+)
+
+
+def _sent_response(transport: FakeTransport, index: int = 0) -> SipResponse:
+    """Return a captured message, checking it is a response."""
+    msg, _ = transport.sent[index]
+    assert msg.kind == SipMessage.KIND_RESPONSE
+    return msg
 
 
 # --- Tests ---
@@ -144,20 +141,19 @@ def _make_options() -> str:
 
 class TestSipUASInvite:
     @pytest.fixture()
-    def uas_setup(self) -> tuple[SipUAS, FakeTransport, list[IncomingCall]]:
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
+    def uas_setup(
+        self, wired_uas: tuple[SipUAS, FakeTransport]
+    ) -> tuple[SipUAS, FakeTransport, list[IncomingCall]]:
+        uas, transport = wired_uas
         calls: list[IncomingCall] = []
-        uas.on_invite = lambda call: calls.append(call)
-        # Don't start (no event loop needed for inject)
-        transport.on_message = uas._on_message
+        uas.on_invite = calls.append
         return uas, transport, calls
 
     def test_invite_creates_call(
         self, uas_setup: tuple[SipUAS, FakeTransport, list[IncomingCall]]
     ) -> None:
         uas, transport, calls = uas_setup
-        transport.inject(INVITE_RAW)
+        transport.inject(INVITE_MSG)
 
         assert len(calls) == 1
         call = calls[0]
@@ -170,12 +166,11 @@ class TestSipUASInvite:
         self, uas_setup: tuple[SipUAS, FakeTransport, list[IncomingCall]]
     ) -> None:
         uas, transport, calls = uas_setup
-        transport.inject(INVITE_RAW)
+        transport.inject(INVITE_MSG)
 
         # First sent message should be 100 Trying
         assert len(transport.sent) >= 1
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
+        resp = _sent_response(transport)
         assert resp.status_code == 100
         assert resp.reason_phrase == "Trying"
 
@@ -183,7 +178,7 @@ class TestSipUASInvite:
         self, uas_setup: tuple[SipUAS, FakeTransport, list[IncomingCall]]
     ) -> None:
         uas, transport, calls = uas_setup
-        transport.inject(INVITE_WITH_SDP)
+        transport.inject(INVITE_WITH_SDP_MSG)
 
         call = calls[0]
         assert call.sdp_offer is not None
@@ -194,14 +189,14 @@ class TestSipUASInvite:
         self, uas_setup: tuple[SipUAS, FakeTransport, list[IncomingCall]]
     ) -> None:
         uas, transport, calls = uas_setup
-        transport.inject(INVITE_RAW)
+        transport.inject(INVITE_MSG)
 
         active = uas.active_calls
         assert "test-call-1@example.com" in active
 
     def test_get_call(self, uas_setup: tuple[SipUAS, FakeTransport, list[IncomingCall]]) -> None:
         uas, transport, calls = uas_setup
-        transport.inject(INVITE_RAW)
+        transport.inject(INVITE_MSG)
 
         call = uas.get_call("test-call-1@example.com")
         assert call is not None
@@ -209,7 +204,7 @@ class TestSipUASInvite:
 
     def test_get_dialog(self, uas_setup: tuple[SipUAS, FakeTransport, list[IncomingCall]]) -> None:
         uas, transport, calls = uas_setup
-        transport.inject(INVITE_RAW)
+        transport.inject(INVITE_MSG)
 
         dialog = uas.get_dialog("test-call-1@example.com")
         assert dialog is not None
@@ -225,13 +220,13 @@ class TestSipUASInvite:
 
 class TestIncomingCallResponses:
     @pytest.fixture()
-    def call_setup(self) -> tuple[IncomingCall, FakeTransport]:
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
+    def call_setup(
+        self, wired_uas: tuple[SipUAS, FakeTransport]
+    ) -> tuple[IncomingCall, FakeTransport]:
+        uas, transport = wired_uas
         calls: list[IncomingCall] = []
-        uas.on_invite = lambda call: calls.append(call)
-        transport.on_message = uas._on_message
-        transport.inject(INVITE_RAW)
+        uas.on_invite = calls.append
+        transport.inject(INVITE_MSG)
         return calls[0], transport
 
     def test_ringing(self, call_setup: tuple[IncomingCall, FakeTransport]) -> None:
@@ -240,8 +235,7 @@ class TestIncomingCallResponses:
 
         call.ringing()
         assert len(transport.sent) == 1
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
+        resp = _sent_response(transport)
         assert resp.status_code == 180
 
     def test_accept(self, call_setup: tuple[IncomingCall, FakeTransport]) -> None:
@@ -250,8 +244,7 @@ class TestIncomingCallResponses:
 
         call.accept()
         assert len(transport.sent) == 1
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
+        resp = _sent_response(transport)
         assert resp.status_code == 200
         assert call.dialog.state == DialogState.CONFIRMED
 
@@ -262,33 +255,37 @@ class TestIncomingCallResponses:
         sdp = build_sdp("10.0.0.2", 30000, 0, "PCMU")
         call.accept(sdp)
 
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
+        resp = _sent_response(transport)
         assert resp.status_code == 200
         assert resp.content_type == "application/sdp"
         assert resp.body != ""
 
-    def test_reject(self, call_setup: tuple[IncomingCall, FakeTransport]) -> None:
+    @pytest.mark.parametrize(
+        ("code", "reason", "expected_reason"),
+        [
+            (486, "", "Busy Here"),
+            (603, "Decline", "Decline"),
+            (480, "", "Temporarily Unavailable"),
+        ],
+        ids=["busy-default-reason", "decline-custom-reason", "unavailable-default-reason"],
+    )
+    def test_reject(
+        self,
+        call_setup: tuple[IncomingCall, FakeTransport],
+        code: int,
+        reason: str,
+        expected_reason: str,
+    ) -> None:
         call, transport = call_setup
         transport.sent.clear()
 
-        call.reject(486)
+        call.reject(code, reason)
         assert len(transport.sent) == 1
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
-        assert resp.status_code == 486
+        resp = _sent_response(transport)
+        assert resp.status_code == code
+        assert resp.reason_phrase == expected_reason
         assert call.dialog.state == DialogState.TERMINATED
 
-    def test_reject_custom_reason(self, call_setup: tuple[IncomingCall, FakeTransport]) -> None:
-        call, transport = call_setup
-        transport.sent.clear()
-
-        call.reject(603, "Decline")
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
-        assert resp.status_code == 603
-        assert resp.reason_phrase == "Decline"
-
     def test_hangup(self, call_setup: tuple[IncomingCall, FakeTransport]) -> None:
         call, transport = call_setup
         call.accept()
@@ -307,27 +304,11 @@ class TestIncomingCallResponses:
 
 
 class TestIncomingCallProperties:
-    def test_x_headers(self) -> None:
-        raw = (
-            "INVITE sip:bob@10.0.0.2:5060 SIP/2.0\r\n"
-            "Via: SIP/2.0/UDP 10.0.0.1:5060;branch=z9hG4bK-x-1;rport\r\n"
-            "From: <sip:alice@example.com>;tag=xtag\r\n"
-            "To: <sip:bob@example.com>\r\n"
-            "Call-ID: x-call@example.com\r\n"
-            "CSeq: 1 INVITE\r\n"
-            "Contact: <sip:alice@10.0.0.1:5060>\r\n"
-            "X-Room-ID: room-42\r\n"
-            "X-Session-ID: sess-99\r\n"
-            "X-Custom: custom-val\r\n"
-            "Content-Length: 0\r\n"
-            "\r\n"
-        )
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
+    def test_x_headers(self, wired_uas: tuple[SipUAS, FakeTransport]) -> None:
+        uas, transport = wired_uas
         calls: list[IncomingCall] = []
-        uas.on_invite = lambda call: calls.append(call)
-        transport.on_message = uas._on_message
-        transport.inject(raw)
+        uas.on_invite = calls.append
+        transport.inject(X_HEADERS_INVITE)
 
         call = calls[0]
         assert call.room_id == "room-42"
@@ -339,17 +320,15 @@ class TestIncomingCallProperties:
 
 
 class TestSipUASBye:
-    def test_bye_terminates_call(self) -> None:
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
+    def test_bye_terminates_call(self, wired_uas: tuple[SipUAS, FakeTransport]) -> None:
+        uas, transport = wired_uas
         calls: list[IncomingCall] = []
         bye_calls: list[tuple[IncomingCall, SipRequest]] = []
-        uas.on_invite = lambda call: calls.append(call)
+        uas.on_invite = calls.append
         uas.on_bye = lambda call, req: bye_calls.append((call, req))
-        transport.on_message = uas._on_message
 
         # INVITE
-        transport.inject(INVITE_RAW)
+        transport.inject(INVITE_MSG)
         call = calls[0]
         call.accept()
 
@@ -362,8 +341,7 @@ class TestSipUASBye:
 
         # Should send 200 OK for BYE
         assert len(transport.sent) >= 1
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
+        resp = _sent_response(transport)
         assert resp.status_code == 200
 
         # Dialog terminated
@@ -375,33 +353,28 @@ class TestSipUASBye:
         # Call removed from active
         assert uas.get_call("test-call-1@example.com") is None
 
-    def test_bye_no_dialog(self) -> None:
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
-        transport.on_message = uas._on_message
+    def test_bye_no_dialog(self, wired_uas: tuple[SipUAS, FakeTransport]) -> None:
+        uas, transport = wired_uas
 
         bye_raw = _make_bye("nonexistent@example.com", "x", "y")
         transport.inject(bye_raw)
 
         # Should send 481
         assert len(transport.sent) >= 1
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
+        resp = _sent_response(transport)
         assert resp.status_code == 481
 
 
 class TestSipUASCancel:
-    def test_cancel_pending_invite(self) -> None:
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
+    def test_cancel_pending_invite(self, wired_uas: tuple[SipUAS, FakeTransport]) -> None:
+        uas, transport = wired_uas
         calls: list[IncomingCall] = []
         cancel_events: list[tuple[SipRequest, tuple[str, int]]] = []
-        uas.on_invite = lambda call: calls.append(call)
+        uas.on_invite = calls.append
         uas.on_cancel = lambda req, addr: cancel_events.append((req, addr))
-        transport.on_message = uas._on_message
 
         # INVITE (not accepted)
-        transport.inject(INVITE_RAW)
+        transport.inject(INVITE_MSG)
         transport.sent.clear()
 
         # CANCEL
@@ -419,29 +392,24 @@ class TestSipUASCancel:
 
 
 class TestSipUASOptions:
-    def test_options_default_response(self) -> None:
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
-        transport.on_message = uas._on_message
+    def test_options_default_response(self, wired_uas: tuple[SipUAS, FakeTransport]) -> None:
+        uas, transport = wired_uas
 
-        transport.inject(_make_options())
+        transport.inject(OPTIONS_MSG)
 
         assert len(transport.sent) >= 1
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
+        resp = _sent_response(transport)
         assert resp.status_code == 200
         allow = resp.get_header("allow")
         assert allow is not None
         assert "INVITE" in allow
 
-    def test_options_custom_handler(self) -> None:
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
+    def test_options_custom_handler(self, wired_uas: tuple[SipUAS, FakeTransport]) -> None:
+        uas, transport = wired_uas
         handled: list[SipRequest] = []
         uas.on_options = lambda req, addr: handled.append(req)
-        transport.on_message = uas._on_message
 
-        transport.inject(_make_options())
+        transport.inject(OPTIONS_MSG)
 
         assert len(handled) == 1
         # No default response sent when custom handler is set
@@ -449,10 +417,8 @@ class TestSipUASOptions:
 
 
 class TestSipUASUnsupportedMethod:
-    def test_unknown_method_405(self) -> None:
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
-        transport.on_message = uas._on_message
+    def test_unknown_method_405(self, wired_uas: tuple[SipUAS, FakeTransport]) -> None:
+        uas, transport = wired_uas
 
         raw = (
             "INFO sip:bob@10.0.0.2:5060 SIP/2.0\r\n"
@@ -467,40 +433,36 @@ class TestSipUASUnsupportedMethod:
         transport.inject(raw)
 
         assert len(transport.sent) >= 1
-        resp, _ = transport.sent[0]
-        assert isinstance(resp, SipResponse)
+        resp = _sent_response(transport)
         assert resp.status_code == 405
 
 
 class TestFullCallFlow:
     """Integration test: INVITE → 100 → 180 → 200 → ACK → BYE → 200."""
 
-    def test_full_invite_flow(self) -> None:
-        transport = FakeTransport()
-        uas = SipUAS(transport)  # type: ignore[arg-type]
+    def test_full_invite_flow(self, wired_uas: tuple[SipUAS, FakeTransport]) -> None:
+        uas, transport = wired_uas
         calls: list[IncomingCall] = []
         bye_events: list[tuple[IncomingCall, SipRequest]] = []
-        uas.on_invite = lambda call: calls.append(call)
+        uas.on_invite = calls.append
         uas.on_bye = lambda call, req: bye_events.append((call, req))
-        transport.on_message = uas._on_message
 
         # 1. INVITE
-        transport.inject(INVITE_WITH_SDP)
+        transport.inject(INVITE_WITH_SDP_MSG)
         call = calls[0]
 
         # Auto 100 Trying was sent
-        assert transport.sent[0][0].status_code == 100  # type: ignore[union-attr]
+        assert _sent_response(transport).status_code == 100
 
         # 2. 180 Ringing
         call.ringing()
-        assert transport.sent[-1][0].status_code == 180  # type: ignore[union-attr]
+        assert _sent_response(transport, -1).status_code == 180
 
         # 3. Negotiate SDP and accept
         assert call.sdp_offer is not None
         answer, chosen_pt = negotiate_sdp(call.sdp_offer, "10.0.0.2", 30000)
         call.accept(answer)
-        resp_200 = transport.sent[-1][0]
-        assert isinstance(resp_200, SipResponse)
+        resp_200 = _sent_response(transport, -1)
         assert resp_200.status_code == 200
         assert resp_200.body != ""
         assert call.dialog.state == DialogState.CONFIRMED
@@ -519,8 +481,7 @@ class TestFullCallFlow:
 
         # Should send 200 for BYE
         assert len(transport.sent) >= 1
-        bye_resp = transport.sent[0][0]
-        assert isinstance(bye_resp, SipResponse)
+        bye_resp = _sent_response(transport)
         assert bye_resp.status_code == 200
 
         # Dialog terminated
@@ -531,8 +492,7 @@ class TestFullCallFlow:
 
 class TestSipUASStartStop:
     @pytest.mark.asyncio()
-    async def test_start_stop(self) -> None:
-        transport = FakeTransport()
+    async def test_start_stop(self, transport: FakeTransport) -> None:
         uas = SipUAS(transport)  # type: ignore[arg-type]
 
         await uas.start()
@@ -1,5 +1,10 @@
 """Tests for aiosipua.utils."""
 
+from collections.abc import Callable
+from functools import partial
+
+import pytest
+
 from aiosipua.utils import generate_branch, generate_call_id, generate_tag
 
 
@@ -11,10 +16,6 @@ class TestGenerateCallId:
         assert domain == "example.com"
         assert len(local) > 0
 
-    def test_uniqueness(self) -> None:
-        ids = {generate_call_id("example.com") for _ in range(100)}
-        assert len(ids) == 100
-
 
 class TestGenerateBranch:
     def test_magic_cookie_prefix(self) -> None:
@@ -26,10 +27,6 @@ class TestGenerateBranch:
         # "z9hG4bK" (7) + 16 hex chars
         assert len(branch) == 23
 
-    def test_uniqueness(self) -> None:
-        branches = {generate_branch() for _ in range(100)}
-        assert len(branches) == 100
-
 
 class TestGenerateTag:
     def test_format(self) -> None:
@@ -38,6 +35,12 @@ class TestGenerateTag:
         assert len(tag) == 16
         int(tag, 16)  # should not raise
 
-    def test_uniqueness(self) -> None:
-        tags = {generate_tag() for _ in range(100)}
-        assert len(tags) == 100
+
+class TestUniqueness:
+    @pytest.mark.parametrize(
+        "generate",
+        [partial(generate_call_id, "example.com"), generate_branch, generate_tag],
+        ids=["call_id", "branch", "tag"],
+    )
+    def test_uniqueness(self, generate: Callable[[], str]) -> None:
+        assert len({generate() for _ in range(100)}) == 100